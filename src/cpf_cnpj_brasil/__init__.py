@@ -1,6 +1,8 @@
 """
  Inicialização dos pacotes de validação de CPF e CNPJ.
 """
+import importlib
+
 from .cpf_validator_gemini import CPF
 from .cnpj_validator_gemini import CNPJ
 from .exceptions import (
@@ -14,8 +16,26 @@ __version__ = "0.1.0"
 __all__ = [
     "CPF",
     "CNPJ",
+    "CPFValidator",
+    "CNPJValidator",
     "CpfCnpjException",
     "CNPJValidationError",
     "CNPJAPIError",
     "CPFValidationError",
 ]
+
+# Classes legadas, carregadas apenas quando acessadas (PEP 562) para não
+# importar duas implementações na inicialização do pacote
+_LAZY_EXPORTS = {
+    "CPFValidator": ".cpf_validator",
+    "CNPJValidator": ".cnpj_validator",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
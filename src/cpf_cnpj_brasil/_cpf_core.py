@@ -0,0 +1,61 @@
+"""
+Núcleo de cálculo do CPF compartilhado pelas classes CPF e CPFValidator.
+
+Reúne as tabelas, os pesos e o cálculo dos dígitos verificadores, para que
+as duas interfaces usem uma única implementação.
+"""
+from typing import Tuple
+
+from .utils import mod11_digit_table, unrolled_weighted_sum
+
+# Tabela de tradução para remover pontuação e espaços
+_STRIP_TABLE = str.maketrans('', '', './-\t\n\r\v\f ')
+
+# CPFs com todos os dígitos iguais (ex: "11111111111"), sempre inválidos
+_BLOCKED_CPF = frozenset(digit * 11 for digit in '0123456789')
+
+# Tabela de tradução de bytes: dígito ASCII -> valor numérico (0-9)
+_DIGIT_VALUES = bytes(range(256)).translate(
+    bytes.maketrans(b'0123456789', bytes(range(10)))
+)
+
+# Pesos dos dígitos verificadores (tuplas imutáveis, compartilhadas)
+_WEIGHTS1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_WEIGHTS2 = (11,) + _WEIGHTS1
+
+# Somas ponderadas desenroladas dos dígitos verificadores
+_weighted_sum1 = unrolled_weighted_sum(_WEIGHTS1)
+_weighted_sum2 = unrolled_weighted_sum(_WEIGHTS2)
+
+# Dígito verificador indexado pela soma ponderada; o tamanho cobre
+# qualquer byte (até 255) em todas as posições
+_CHECK_DIGIT = mod11_digit_table(255 * sum(_WEIGHTS2))
+
+
+def _calc_digits_ascii(ascii_cpf: bytes) -> Tuple[int, int]:
+    """
+    Calcula os dois dígitos verificadores a partir dos códigos ASCII.
+
+    Trabalha direto sobre um buffer de bytes (ex: uma linha uint8 de um
+    array ou um registro lido em modo binário), sem decodificar para str.
+
+    Parâmetros:
+        ascii_cpf (bytes | bytearray): CPF limpo em ASCII (ao menos os
+                                       9 primeiros dígitos).
+
+    Retorna:
+        tuple: (dígito 1, dígito 2).
+    """
+    # Converter os dígitos ASCII em valores numéricos de uma só vez
+    values = ascii_cpf.translate(_DIGIT_VALUES)
+
+    # Calcular primeiro dígito verificador
+    total = _weighted_sum1(values)
+    digit1 = _CHECK_DIGIT[total]
+
+    # Calcular segundo dígito verificador: os pesos são os do primeiro + 1
+    # e o dígito 1 tem peso 2
+    total += sum(values[:9]) + digit1 * 2
+    digit2 = _CHECK_DIGIT[total]
+
+    return digit1, digit2
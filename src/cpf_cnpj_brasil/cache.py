@@ -0,0 +1,127 @@
+"""
+Cache de respostas da API de consulta de CNPJ.
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    """Resposta armazenada no ResponseCache."""
+    data: Optional[Dict[str, Any]]
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        """Indica se a entrada ainda está dentro do TTL."""
+        return self.expires_at > time.time()
+
+
+class ResponseCache:
+    """
+    Cache de respostas de API com TTL, em memória ou persistido em SQLite.
+
+    Entradas expiradas continuam disponíveis para revalidação condicional
+    (ETag / Last-Modified) até serem sobrescritas. Em memória, o cache
+    guarda no máximo max_size entradas e descarta a usada há mais tempo
+    (LRU) quando o limite é atingido.
+
+    As respostas são guardadas como JSON: cada leitura devolve uma cópia
+    nova, de modo que alterar o resultado não corrompe o cache.
+
+    Thread-safe: todas as operações são feitas sob lock.
+
+    Parâmetros:
+        path (str, opcional): Arquivo SQLite para persistir o cache entre
+                              execuções; None mantém o cache só em memória.
+        max_size (int): Número máximo de entradas em memória (padrão: 4096).
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 max_size: int = 4096) -> None:
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, data TEXT, expires_at REAL, "
+                    "etag TEXT, last_modified TEXT)"
+                )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Busca uma entrada (válida ou expirada) no cache.
+
+        Parâmetros:
+            key (str): Chave da entrada.
+
+        Retorna:
+            CacheEntry: A entrada armazenada.
+            None: Se não houver entrada para a chave.
+        """
+        with self._lock:
+            if self._db is None:
+                row = self._memory.get(key)
+                if row is not None:
+                    self._memory.move_to_end(key)
+            else:
+                row = self._db.execute(
+                    "SELECT data, expires_at, etag, last_modified "
+                    "FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        if row is None:
+            return None
+        data, expires_at, etag, last_modified = row
+        return CacheEntry(json.loads(data), expires_at, etag, last_modified)
+
+    def set(self, key: str, data: Optional[Dict[str, Any]], ttl: float,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Armazena (ou substitui) uma entrada no cache.
+
+        Parâmetros:
+            key (str): Chave da entrada.
+            data (dict, opcional): Resposta a armazenar (None para "não encontrado").
+            ttl (float): Tempo de validade em segundos.
+            etag (str, opcional): Cabeçalho ETag da resposta.
+            last_modified (str, opcional): Cabeçalho Last-Modified da resposta.
+        """
+        row = (json.dumps(data), time.time() + ttl, etag, last_modified)
+        with self._lock:
+            if self._db is None:
+                self._memory[key] = row
+                self._memory.move_to_end(key)
+                if len(self._memory) > self.max_size:
+                    self._memory.popitem(last=False)
+                return
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, *row)
+                )
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Fecha o arquivo SQLite, se houver."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -3,12 +3,162 @@ Classe para validação de CNPJ (Cadastro Nacional da Pessoa Jurídica).
 Suporta formato numérico (tradicional) e alfanumérico (a partir de junho/2026).
 Implementação baseada na especificação oficial do SERPRO.
 """
+import copy
+import functools
 import re
-from datetime import datetime
-from typing import Dict, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import time
 import requests
 
+from .utils import (
+    TokenBucket,
+    mod11_digit_table,
+    parse_release_date,
+    parse_retry_after,
+    retrying_adapter,
+    unrolled_weighted_sum,
+)
+
+# Tabela de tradução para remover pontuação e espaços
+_STRIP_TABLE = str.maketrans('', '', './- \t\n\r\v\f')
+
+
+def _strip(cnpj: str) -> str:
+    """
+    Remove pontuação e espaços do CNPJ.
+
+    A tabela cobre os espaços ASCII (caminho rápido); quando o resultado
+    não tem 14 caracteres, remove também os demais espaços Unicode (ex:
+    NBSP U+00A0, U+2003, U+001C-U+001F), como fazia o \\s da regex.
+    """
+    clean_cnpj = cnpj.translate(_STRIP_TABLE)
+    if len(clean_cnpj) != 14:
+        clean_cnpj = ''.join(clean_cnpj.split())
+    return clean_cnpj
+
+
+# CNPJs com todos os caracteres iguais (ex: "00000000000000"), sempre inválidos
+_BLOCKED_CNPJ = frozenset(
+    char * 14 for char in '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# Padrão da data de liberação nas mensagens de rate limit da API
+# Ex: "Mon Oct 27 2025 14:30:00 GMT-0300"
+_RE_RELEASE = re.compile(
+    r'([A-Z][a-z]{2}\s+[A-Z][a-z]{2}\s+\d{2}\s+\d{4}\s+\d{2}:\d{2}:\d{2})\s+GMT([+-]\d{4})')
+
+# Tabela de 256 posições: byte ASCII -> valor do caractere (0xFF = inválido)
+# '0'-'9' → 0-9 e 'A'-'Z' → 17-42, conforme especificação SERPRO
+_INVALID_VALUE = 0xFF
+_LUT = bytearray([_INVALID_VALUE] * 256)
+for _i, _c in enumerate(b'0123456789'):
+    _LUT[_c] = _i
+for _i, _c in enumerate(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+    _LUT[_c] = 17 + _i
+_LUT = bytes(_LUT)
+del _i, _c
+
+
+def _to_values(text: str) -> bytes:
+    """
+    Converte os caracteres do CNPJ em seus valores numéricos via _LUT.
+
+    Caracteres fora da tabela ASCII são mapeados para _INVALID_VALUE.
+    """
+    return text.encode('ascii', 'replace').translate(_LUT)
+
+
+# Pesos dos dígitos verificadores (compartilhados por todas as instâncias)
+_W1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_W2 = (6,) + _W1
+
+# Somas ponderadas desenroladas (pesos constantes embutidos no código)
+_weighted_sum1 = unrolled_weighted_sum(_W1)
+_weighted_sum2 = unrolled_weighted_sum(_W2)
+
+# Dígito verificador indexado pela soma ponderada; o tamanho cobre
+# qualquer byte (até 255) em todas as posições
+_CHECK_DIGIT = mod11_digit_table(255 * sum(_W2))
+
+
+def _compute_digits(values) -> Tuple[int, int]:
+    """
+    Calcula os dois dígitos verificadores a partir dos 12 primeiros valores.
+
+    Parâmetros:
+        values (bytes): Valores (via _LUT) do CNPJ; apenas os 12 primeiros
+                        são usados, então o CNPJ completo pode ser passado.
+
+    Retorna:
+        tuple: (primeiro dígito, segundo dígito).
+    """
+    # Dígito = 11 - resto, ou 0 quando o resto é menor que 2 (via tabela)
+    total = _weighted_sum1(values)
+    digit1 = _CHECK_DIGIT[total]
+
+    # A segunda soma reaproveita a primeira em vez de reler os pesos: os
+    # pesos do segundo são os do primeiro + 1, exceto na posição 4 (2 em
+    # vez de 9 + 1, ou seja, -8); o dígito 1 tem peso 2
+    total += sum(values[:12]) - 8 * values[4] + digit1 * 2
+    digit2 = _CHECK_DIGIT[total]
+    return digit1, digit2
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_cnpj(cnpj: str) -> str:
+    """
+    Limpa e valida o formato de um CNPJ em string (memoizado).
+
+    Parâmetros:
+        cnpj (str): CNPJ numérico ou alfanumérico, com ou sem pontuação.
+
+    Retorna:
+        str: CNPJ limpo (14 caracteres, uppercase, sem pontuação).
+
+    Raises:
+        ValueError: Se o CNPJ tiver formato inválido.
+    """
+
+    # Remover pontuação; maiúsculas só depois de garantir ASCII
+    # (upper() pode expandir caracteres, ex: 'ﬀ' -> 'FF')
+    clean_cnpj = _strip(cnpj)
+
+    # Verificar se tem 14 caracteres
+    if len(clean_cnpj) != 14:
+        raise ValueError(
+            "CNPJ deve ter 14 caracteres (letras A-Z ou números 0-9).")
+
+    # Verificar se todos são alfanuméricos (A-Z ou 0-9)
+    if not (clean_cnpj.isascii() and clean_cnpj.isalnum()):
+        raise ValueError(
+            "CNPJ deve conter apenas letras (A-Z) e números (0-9).")
+
+    return clean_cnpj.upper()
+
+
+@functools.lru_cache(maxsize=4096)
+def _check_digits(cnpj: str) -> bool:
+    """
+    Confere os dígitos verificadores de um CNPJ já limpo (memoizado).
+
+    Parâmetros:
+        cnpj (str): CNPJ limpo (14 caracteres A-Z/0-9).
+
+    Retorna:
+        bool: True se válido, False caso contrário.
+    """
+
+    # Verificar se todos os caracteres são iguais (ex: 00000000000000)
+    if cnpj in _BLOCKED_CNPJ:
+        return False
+
+    # Converter o CNPJ uma única vez e comparar os dígitos como inteiros
+    values = _to_values(cnpj)
+    return (values[12], values[13]) == _compute_digits(values)
+
 
 class CNPJValidator:
     """
@@ -21,18 +171,48 @@ class CNPJValidator:
     Os dígitos verificadores são sempre numéricos (0-9).
     """
 
-    def __init__(self):
-        # Sequências de pesos para cálculo dos dígitos verificadores
-        self.sequence1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        self.sequence2 = [6] + self.sequence1
+    # Sequências de pesos para cálculo dos dígitos verificadores
+    # (tuplas compartilhadas pela classe, sem alocação por instância)
+    sequence1 = _W1
+    sequence2 = _W2
 
+    def __init__(self):
         # URL base da API CNPJws
         self._base_url = "https://publica.cnpj.ws/cnpj/"
 
+        # Sessão HTTP reutilizada entre consultas (pool de conexões TLS),
+        # com a mesma política de novas tentativas da classe CNPJ: uma
+        # resposta 5xx que esgota as tentativas é informada pelo status code
+        self._session = requests.Session()
+        self._session.mount("https://", retrying_adapter(pool_maxsize=16))
+
         # Controle de rate limit: máximo 3 requisições/minuto
-        self._last_request_time = 0
         self._min_interval = 60 / 3  # 20 segundos entre requisições
 
+        # Token bucket: reabastece 1 ficha a cada _min_interval segundos,
+        # acumulando no máximo 1 ficha
+        self._rate_limiter = TokenBucket(
+            capacity=1, rate_per_sec=1 / self._min_interval)
+
+        # Cache em memória das consultas: cnpj -> (expira_em, resposta)
+        self._cache_lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._cache_ttl = 300  # segundos para CNPJs encontrados (200)
+        self._cache_ttl_not_found = 60  # segundos para CNPJs não encontrados (404)
+        self._cache_max_size = 1024
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Encerra a sessão HTTP e libera as conexões do pool.
+        """
+        self._session.close()
+
     @staticmethod
     def _character_to_value(character) -> int:
         """
@@ -52,11 +232,11 @@ class CNPJValidator:
             '0'-'9' → 0-9
             'A'-'Z' → 17-42
         """
-        value = ord(character) - 48
+        code = ord(character)
+        value = _LUT[code] if code < 256 else _INVALID_VALUE
 
-        # Valida se o caractere está no intervalo esperado
-        # '0'-'9': 0-9 ou 'A'-'Z': 17-42
-        if not (0 <= value <= 9 or 17 <= value <= 42):
+        # Valida se o caractere está na tabela ('0'-'9' ou 'A'-'Z')
+        if value == _INVALID_VALUE:
             raise ValueError(f"Caractere inválido: '{character}'")
 
         return value
@@ -77,6 +257,18 @@ class CNPJValidator:
             ValueError: Se o CNPJ tiver formato inválido.
         """
 
+        # String primeiro (caso mais comum): pode ser alfanumérico
+        # (resultado memoizado)
+        if isinstance(cnpj, str):
+            # Já limpo (14 caracteres ASCII sem pontuação): dispensa a
+            # limpeza e a consulta ao cache
+            if len(cnpj) == 14 and cnpj.isascii():
+                if cnpj.isdigit():
+                    return cnpj
+                if cnpj.isalnum():
+                    return cnpj.upper()
+            return _clean_cnpj(cnpj)
+
         # Converter para string se for inteiro (apenas numéricos)
         if isinstance(cnpj, int):
             cnpj = str(cnpj).zfill(14)
@@ -87,26 +279,6 @@ class CNPJValidator:
                     "CNPJ com formato inválido. Inteiro deve ter no máximo 14 dígitos.")
             return cnpj
 
-        # Se for string, pode ser alfanumérico
-        if isinstance(cnpj, str):
-            # Converter para maiúsculas
-            cnpj = cnpj.upper()
-
-            # Remover pontuação mas manter alfanuméricos
-            clean_cnpj = re.sub(r'[.\-/\s]', '', cnpj)
-
-            # Verificar se tem 14 caracteres
-            if len(clean_cnpj) != 14:
-                raise ValueError(
-                    "CNPJ deve ter 14 caracteres (letras A-Z ou números 0-9).")
-
-            # Verificar se todos são alfanuméricos (A-Z ou 0-9)
-            if not re.match(r'^[A-Z0-9]{14}$', clean_cnpj):
-                raise ValueError(
-                    "CNPJ deve conter apenas letras (A-Z) e números (0-9).")
-
-            return clean_cnpj
-
         raise ValueError("CNPJ deve ser string ou inteiro.")
 
     def _calculate_digit(self, partial_cnpj):
@@ -123,19 +295,19 @@ class CNPJValidator:
             ValueError: Se as entradas forem incompatíveis.
         """
 
-        # Definir sequência de pesos com base no comprimento do partial_cnpj
+        # Definir a soma ponderada com base no comprimento do partial_cnpj
         if len(partial_cnpj) == 12:
-            sequence = self.sequence1
+            weighted_sum = _weighted_sum1
         elif len(partial_cnpj) == 13:
-            sequence = self.sequence2
+            weighted_sum = _weighted_sum2
         else:
             raise ValueError("CNPJ parcial deve ter 12 ou 13 dígitos.")
 
-        # Calcular o dígito verificador
-        sum_value = sum(self._character_to_value(digit) * weight for digit,
-                   weight in zip(partial_cnpj, sequence))
-        remainder = sum_value % 11
-        return 0 if remainder < 2 else 11 - remainder
+        # Converter os caracteres uma única vez e somar com os pesos
+        values = _to_values(partial_cnpj)
+        if _INVALID_VALUE in values:
+            raise ValueError(f"Caractere inválido em: '{partial_cnpj}'")
+        return _CHECK_DIGIT[weighted_sum(values)]
 
     @staticmethod
     def format_cnpj(cnpj):
@@ -151,7 +323,20 @@ class CNPJValidator:
         """
 
         # Validar formato do CNPJ e retornar formatado
-        cnpj = CNPJValidator._validate_input_format(cnpj)
+        return CNPJValidator._format_clean(
+            CNPJValidator._validate_input_format(cnpj))
+
+    @staticmethod
+    def _format_clean(cnpj):
+        """
+        Formata um CNPJ já limpo (14 caracteres) sem validá-lo novamente.
+
+        Parâmetros:
+            cnpj (str): CNPJ limpo, retornado por _validate_input_format.
+
+        Retorna:
+            str: CNPJ formatado.
+        """
         return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
 
     def validate_cnpj(self, cnpj):
@@ -165,17 +350,41 @@ class CNPJValidator:
             bool: True se válido, False caso contrário.
         """
 
-        # Validar formato do CNPJ
-        cnpj = self._validate_input_format(cnpj)
+        # Validar formato do CNPJ e conferir os dígitos do CNPJ limpo
+        return _check_digits(self._validate_input_format(cnpj))
 
-        # Calcular primeiro dígito verificador
-        digit1 = self._calculate_digit(cnpj[:12])
+    def validate_many(self, cnpjs: Sequence[Any]) -> List[bool]:
+        """
+        Valida uma sequência de CNPJs (numéricos ou alfanuméricos) em lote.
+
+        Parâmetros:
+            cnpjs (sequência de str ou int): CNPJs a serem validados.
 
-        # Calcular segundo dígito verificador
-        digit2 = self._calculate_digit(cnpj[:12] + str(digit1))
+        Retorna:
+            list[bool]: Resultado da validação de cada CNPJ, na mesma ordem.
+            CNPJs com formato inválido ou com todos os caracteres iguais
+            resultam em False, sem levantar erro.
+        """
 
-        # Verificar se os dígitos calculados correspondem aos dígitos do CNPJ
-        return cnpj[-2:] == f"{digit1}{digit2}"
+        # Limpar as entradas em uma única passada, sem regex por item
+        clean_list = []
+        for cnpj in cnpjs:
+            if isinstance(cnpj, str):
+                clean_cnpj = _strip(cnpj)
+                # Maiúsculas apenas em ASCII (upper() pode expandir Unicode)
+                clean_list.append(
+                    clean_cnpj.upper() if clean_cnpj.isascii() else '')
+            elif isinstance(cnpj, int) and cnpj >= 0:
+                clean_list.append(str(cnpj).zfill(14))
+            else:
+                clean_list.append('')
+
+        results = []
+        for clean_cnpj in clean_list:
+            results.append(len(clean_cnpj) == 14 and clean_cnpj.isascii()
+                           and clean_cnpj.isalnum()
+                           and _check_digits(clean_cnpj))
+        return results
 
     def find_headquarters(self, branch_cnpj):
         """
@@ -195,38 +404,92 @@ class CNPJValidator:
         # Validar formato do CNPJ da filial
         branch_cnpj = self._validate_input_format(branch_cnpj)
 
-        # Verificar se o CNPJ é válido
-        if not self.validate_cnpj(branch_cnpj):
+        # Verificar se o CNPJ é válido, sem limpar a entrada novamente
+        if not _check_digits(branch_cnpj):
             raise ValueError("CNPJ inserido é inválido.")
 
+        # Já é a matriz: os dígitos verificadores acabaram de ser conferidos
+        if branch_cnpj[8:12] == '0001':
+            return self._format_clean(branch_cnpj)
+
         # Extrair a parte do CNPJ que identifica a empresa (8 primeiros dígitos)
         partial_headquarters_cnpj = branch_cnpj[:8] + '0001'
 
         # Calcular os dígitos verificadores para o CNPJ da matriz
-        digit1 = self._calculate_digit(partial_headquarters_cnpj)
-        digit2 = self._calculate_digit(partial_headquarters_cnpj + str(digit1))
+        digit1, digit2 = _compute_digits(_to_values(partial_headquarters_cnpj))
 
         # Montar o CNPJ completo da matriz
-        headquarters_cnpj = partial_headquarters_cnpj + f"{digit1}{digit2}"
-        return self.format_cnpj(headquarters_cnpj)
+        headquarters_cnpj = (partial_headquarters_cnpj
+                             + chr(48 + digit1) + chr(48 + digit2))
+        return self._format_clean(headquarters_cnpj)
+
+    def _get_cached(self, cnpj):
+        """
+        Busca a resposta de uma consulta anterior ainda válida no cache.
+
+        A resposta é devolvida como cópia, de modo que alterar o resultado
+        não corrompe o cache. CNPJs não encontrados (404) também ficam em
+        cache, com resposta None, por _cache_ttl_not_found segundos.
+
+        Parâmetros:
+            cnpj (str): CNPJ limpo (14 caracteres).
+
+        Retorna:
+            tuple: (True, resposta) se houver entrada válida no cache
+                   (resposta None para CNPJ não encontrado),
+                   (False, None) caso contrário.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(cnpj)
+            if entry is None:
+                return False, None
+
+            expires_at, response_info = entry
+            if time.time() >= expires_at:
+                # Entrada expirada
+                del self._cache[cnpj]
+                return False, None
+
+            self._cache.move_to_end(cnpj)
+        return True, copy.deepcopy(response_info)
+
+    def _store_cached(self, cnpj, response_info, ttl):
+        """
+        Armazena uma cópia da resposta de uma consulta no cache, descartando
+        a entrada mais antiga quando o limite de tamanho é atingido.
+
+        Parâmetros:
+            cnpj (str): CNPJ limpo (14 caracteres).
+            response_info (dict ou None): Resposta da API (None para CNPJ
+                                          não encontrado).
+            ttl (float): Tempo de validade da entrada em segundos.
+        """
+        with self._cache_lock:
+            self._cache[cnpj] = (time.time() + ttl,
+                                 copy.deepcopy(response_info))
+            self._cache.move_to_end(cnpj)
+            if len(self._cache) > self._cache_max_size:
+                self._cache.popitem(last=False)
 
     def _wait_rate_limit(self):
         """
         Aguarda o tempo necessário para respeitar o rate limit da API.
-        Garante que não sejam feitas mais de 50 requisições por segundo.
+        Usa um token bucket thread-safe: cada chamada consome uma ficha e,
+        se não houver ficha disponível, reserva a próxima e aguarda por ela
+        fora do lock, permitindo que várias threads compartilhem a cota.
         """
 
-        # Definir a diferença de tempo desde a última requisição
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
+        self._rate_limiter.acquire()
+
+    def _drain_rate_limit(self, wait_seconds):
+        """
+        Esvazia o token bucket até a liberação informada pela API.
 
-        # Verificar se é necessário aguardar
-        if time_since_last_request < self._min_interval:
-            # Aguarda o tempo necessário para respeitar o rate limit
-            time.sleep(self._min_interval - time_since_last_request)
+        Parâmetros:
+            wait_seconds (float): Segundos até a liberação do rate limit.
+        """
 
-        # Atualizar o tempo da última requisição
-        self._last_request_time = time.time()
+        self._rate_limiter.drain(wait_seconds)
 
     def _extract_and_wait_for_release(self, error_message: str) -> float:
         """
@@ -240,10 +503,8 @@ class CNPJValidator:
             ValueError: Se não for possível extrair a data.
         """
 
-        # Padrão regex para capturar a data no formato da mensagem
-        pattern = r'([A-Z][a-z]{2}\s+[A-Z][a-z]{2}\s+\d{2}\s+\d{4}\s+\d{2}:\d{2}:\d{2})\s+GMT([+-]\d{4})'
-
-        match = re.search(pattern, error_message)
+        # Capturar a data no formato da mensagem (padrão pré-compilado)
+        match = _RE_RELEASE.search(error_message)
 
         if not match:
             raise ValueError("Não foi possível extrair a data de liberação.")
@@ -252,29 +513,13 @@ class CNPJValidator:
         date_str = match.group(1)
         timezone_str = match.group(2)  # Ex: "-0300"
 
-        # Parsear a data (sem timezone ainda)
-        release_date = datetime.strptime(date_str, "%a %b %d %Y %H:%M:%S")
-
-        # Calcular o offset do timezone da mensagem em segundos
-        tz_hours = int(timezone_str[:3])
-        tz_minutes = int(timezone_str[0] + timezone_str[3:])
-        tz_offset_seconds = tz_hours * 3600 + tz_minutes * 60
-
-        # Converter a data de liberação para timestamp UTC
-        release_timestamp_utc = release_date.timestamp() - tz_offset_seconds
-
-        # Obter o offset do sistema local
-        utc_offset = datetime.now().astimezone().utcoffset()
-        local_offset = utc_offset.total_seconds() if utc_offset is not None else 0
-
-        # Ajustar timestamp para o timezone local
-        release_timestamp_local = release_timestamp_utc + local_offset
-
-        # Tempo atual
-        current_timestamp = time.time()
+        # Parsear a data por posição, sem depender do locale
+        release_date = parse_release_date(date_str, timezone_str)
+        if release_date is None:
+            raise ValueError("Não foi possível extrair a data de liberação.")
 
-        # Calcular quanto tempo falta
-        wait_seconds = release_timestamp_local - current_timestamp
+        # Calcular quanto tempo falta (ambas as datas cientes do fuso horário)
+        wait_seconds = (release_date - datetime.now(timezone.utc)).total_seconds()
 
         # Definir minutos e segundos de espera
         minutes = int(wait_seconds // 60)
@@ -312,50 +557,63 @@ class CNPJValidator:
         # Validar formato do CNPJ
         cnpj = self._validate_input_format(cnpj)
 
+        # Consultas recentes são respondidas pelo cache, sem rate limit
+        hit, cached_info = self._get_cached(cnpj)
+        if hit:
+            return cached_info
+
         # Aguardar para respeitar o rate limit
         self._wait_rate_limit()
 
         try:
             # Fazer a requisição GET
-            response = requests.get(self._base_url + cnpj, timeout=timeout)
-            response_info = response.json()  # Forçar o parsing do JSON para capturar erros
-
-            # Verificar o código de status
-            if response.status_code == 200:
-                # CNPJ encontrado - retornar dados em JSON
+            response = self._session.get(self._base_url + cnpj, timeout=timeout)
+            status_code = response.status_code
+
+            # Verificar o código de status antes de decodificar o JSON,
+            # que só é lido nos casos em que o corpo é utilizado
+            if status_code == 200:
+                # CNPJ encontrado - armazenar no cache e retornar dados em JSON
+                response_info = response.json()
+                self._store_cached(cnpj, response_info, self._cache_ttl)
                 return response_info
 
-            if response.status_code == 404:
+            if status_code == 404:
                 # CNPJ não encontrado
+                self._store_cached(cnpj, None, self._cache_ttl_not_found)
+                response_info = response.json()
                 print(
                     f"{response_info['titulo']}. {response_info['detalhes']}.")
 
-            if response.status_code == 429:
+            elif status_code == 429:
                 # Limite de requisições excedido
+                response_info = response.json()
                 print(
                     f"{response_info['titulo']}. {response_info['detalhes']}.")
-                # Extrair e aguardar liberação
-                wait_for_release = self._extract_and_wait_for_release(response_info['detalhes'])
-                # Aguardar tempo necessário para liberação
-                time.sleep(wait_for_release)
-
-            if response.status_code not in (200, 404, 429):
-                # Outro código de status
+                # Usar o cabeçalho Retry-After; a mensagem é apenas fallback
+                wait_for_release = parse_retry_after(response.headers.get('Retry-After'))
+                if wait_for_release is None:
+                    wait_for_release = self._extract_and_wait_for_release(response_info['detalhes'])
+                # Bloquear o token bucket até a liberação
+                self._drain_rate_limit(wait_for_release)
+
+            else:
+                # Outro código de status (corpo não é decodificado)
                 print(
-                    f"Erro ao consultar CNPJ. Status code: {response.status_code}")
+                    f"Erro ao consultar CNPJ. Status code: {status_code}")
 
             return None
 
         # Levantar exceções específicas para tratamento externo
         except requests.exceptions.SSLError:
             print(
-                f"Erro de certificado SSL ao consultar o CNPJ {self.format_cnpj(cnpj)}. "
+                f"Erro de certificado SSL ao consultar o CNPJ {self._format_clean(cnpj)}. "
                 "Verifique a configuração de certificados do sistema.")
             return None
 
         except requests.exceptions.Timeout:
             print(
-                f"Tempo limite excedido ao consultar o CNPJ {self.format_cnpj(cnpj)}.")
+                f"Tempo limite excedido ao consultar o CNPJ {self._format_clean(cnpj)}.")
             return None
 
         except requests.exceptions.ConnectionError:
@@ -369,3 +627,40 @@ class CNPJValidator:
         except ValueError as e:
             # Re-lançar ValueError de validação de formato
             raise e
+
+    def investigate_many(self, cnpjs, concurrency: int = 3,
+                         timeout: int = 10) -> List[Optional[Dict[str, Any]]]:
+        """
+        Consulta vários CNPJs via API, com requisições concorrentes.
+
+        As consultas compartilham o token bucket da instância, de modo que o
+        rate limit da API continua respeitado; a concorrência apenas sobrepõe
+        a latência de rede das requisições.
+
+        Síncrono: usa um pool de threads e só retorna com todos os
+        resultados, como CNPJ.investigate_many; a versão assíncrona
+        (corrotina) existe apenas na classe CNPJ, em
+        CNPJ.investigate_many_async.
+
+        Parâmetros:
+            cnpjs (iterável de str ou int): CNPJs a serem consultados.
+            concurrency (int): Número máximo de consultas simultâneas (padrão: 3).
+            timeout (int): Tempo máximo de espera por resposta em segundos (padrão: 10).
+        Retorna:
+            list: Resultado de `investigate` para cada CNPJ, na mesma ordem.
+        Levanta:
+            ValueError: Se algum CNPJ tiver formato inválido.
+        """
+
+        # Validar todos os formatos antes de iniciar as consultas
+        clean_cnpjs = [self._validate_input_format(cnpj) for cnpj in cnpjs]
+
+        # Consultar cada CNPJ distinto uma única vez
+        unique_cnpjs = list(dict.fromkeys(clean_cnpjs))
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            found = dict(zip(unique_cnpjs, executor.map(
+                lambda cnpj: self.investigate(cnpj, timeout=timeout),
+                unique_cnpjs
+            )))
+        return [found[cnpj] for cnpj in clean_cnpjs]
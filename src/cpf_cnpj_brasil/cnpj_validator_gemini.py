@@ -4,25 +4,301 @@ Classe para validação de CNPJ (Cadastro Nacional da Pessoa Jurídica).
 Suporta formato numérico (tradicional) e alfanumérico (a partir de junho/2026).
 Implementação baseada na especificação oficial do SERPRO.
 """
+import asyncio
+import functools
+import random
 import re
-import time
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Optional, Union, Literal
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, Literal
 
 import requests
 
-from .utils import rate_limited
+from .cache import ResponseCache
+from .utils import (
+    TokenBucket,
+    mod11_digit_table,
+    parse_release_date,
+    parse_retry_after,
+    retrying_adapter,
+    unrolled_weighted_sum,
+)
 from .exceptions import CNPJValidationError, CNPJAPIError
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Tabela de tradução para remover pontuação e espaços
+_STRIP_TABLE = str.maketrans('', '', './-\t\n\r\v\f ')
+
+# Os mesmos caracteres para bytes.translate (caminho ASCII, mais rápido)
+_STRIP_BYTES = b'./-\t\n\r\v\f '
+
+
+def _strip_all(cnpj: str) -> str:
+    """
+    Remove pontuação e qualquer espaço Unicode (caminho lento).
+
+    As tabelas acima cobrem apenas os espaços ASCII; os demais espaços
+    (ex: NBSP U+00A0, U+2003 e os separadores U+001C-U+001F), que o \\s
+    da limpeza com regex também removia, são tratados via str.split.
+    """
+    return ''.join(cnpj.split()).translate(_STRIP_TABLE)
+
+
+# CNPJs com todos os caracteres iguais (ex: "00000000000000"), sempre inválidos
+_BLOCKED_CNPJ = frozenset(
+    char * 14 for char in '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+
+# Tabela de 256 posições: código ASCII -> valor do caractere no cálculo
+# dos dígitos ('0'-'9' → 0-9, 'A'-'Z' → 17-42); 255 marca caractere inválido
+_INVALID_CHAR = 255
+_CHAR_VALUES = [_INVALID_CHAR] * 256
+for _index, _char in enumerate('0123456789'):
+    _CHAR_VALUES[ord(_char)] = _index
+for _index, _char in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+    _CHAR_VALUES[ord(_char)] = _index + 17
+_CHAR_VALUES = bytes(_CHAR_VALUES)
+del _index, _char
+
+# CNPJs com todos os caracteres iguais, já convertidos pela tabela
+_BLOCKED_VALUES = frozenset(
+    cnpj.encode('ascii').translate(_CHAR_VALUES) for cnpj in _BLOCKED_CNPJ
+)
+
+# Data de liberação nas mensagens de rate limit da API
+# (Quebrado em várias linhas usando re.VERBOSE)
+_RELEASE_RE = re.compile(
+    r"""
+    ([A-Z][a-z]{2}\s+      # Dia da semana (ex: Mon)
+     [A-Z][a-z]{2}\s+      # Mês (ex: Oct)
+     \d{2}\s+              # Dia (ex: 27)
+     \d{4}\s+              # Ano (ex: 2025)
+     \d{2}:\d{2}:\d{2})    # Hora (ex: 14:30:00)
+     \s+GMT                # Literal " GMT"
+     ([+-]\d{4})           # Timezone offset (ex: -0300)
+    """,
+    re.VERBOSE
+)
+
+# Sessão HTTP compartilhada: reaproveita conexões keep-alive e a sessão TLS
+# entre consultas. Política de novas tentativas em retrying_adapter; a
+# última resposta 5xx é devolvida para raise_for_status.
+_SESSION = requests.Session()
+_SESSION.mount("https://", retrying_adapter(pool_maxsize=8))
+_SESSION.headers["Accept"] = "application/json"
+
+
 # Type hints
 CnpjInput = Union[str, int]
 ValidationResult = Union[str, Literal[False]]
 
 
+# Pesos do primeiro dígito verificador e sua soma ponderada desenrolada
+_WEIGHTS1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_WEIGHTS2 = (6,) + _WEIGHTS1
+_weighted_sum1 = unrolled_weighted_sum(_WEIGHTS1)
+
+# Dígito verificador indexado pela soma ponderada; o tamanho cobre
+# qualquer byte (até 255) em todas as posições
+_CHECK_DIGIT = mod11_digit_table(255 * sum(_WEIGHTS2))
+
+
+# Núcleo da validação em funções de módulo: evita a busca de atributos na
+# classe a cada chamada; a classe CNPJ as expõe como métodos estáticos.
+@functools.lru_cache(maxsize=131072)
+def _clean_string(cnpj: str) -> str:
+    """
+    Limpar e validar o formato de um CNPJ em string (memoizado).
+
+    Parâmetros:
+        cnpj (str): CNPJ numérico ou alfanumérico, com ou sem pontuação.
+
+    Retorna:
+        str: CNPJ limpo (14 caracteres, uppercase, sem pontuação).
+
+    Raises:
+        CNPJValidationError: Se o CNPJ tiver formato inválido.
+    """
+
+    # Entradas ASCII são limpas como bytes: translate, isalnum e upper
+    # de bytes não precisam lidar com Unicode
+    try:
+        clean_cnpj = cnpj.encode('ascii').translate(None, _STRIP_BYTES)
+    except UnicodeEncodeError:
+        clean_cnpj = None
+
+    # Fora do caminho rápido, remover também os espaços Unicode
+    if clean_cnpj is None or len(clean_cnpj) != 14:
+        text = _strip_all(cnpj)
+
+        # Verificar se tem 14 caracteres
+        if len(text) != 14:
+            raise CNPJValidationError(
+                "CNPJ deve ter 14 caracteres "
+                "(letras A-Z ou números 0-9).",
+                value=cnpj,
+            )
+        clean_cnpj = text.encode('ascii') if text.isascii() else None
+
+    if clean_cnpj is not None:
+        # Caso mais comum: CNPJ numérico dispensa a conversão de caixa
+        if clean_cnpj.isdigit():
+            return clean_cnpj.decode('ascii')
+
+        # bytes.isalnum considera apenas [A-Za-z0-9]
+        if clean_cnpj.isalnum():
+            return clean_cnpj.upper().decode('ascii')
+
+    raise CNPJValidationError(
+        "CNPJ deve conter apenas letras (A-Z) e números (0-9).",
+        value=cnpj,
+    )
+
+
+def _calc_digits(clean_cnpj: str) -> Tuple[int, int]:
+    """
+    Calcular os dois dígitos verificadores de um CNPJ já limpo.
+
+    Não revalida a entrada: assume a saída de _validate_input_format.
+
+    Parâmetros:
+        clean_cnpj (str): CNPJ limpo (ao menos os 12 primeiros caracteres).
+
+    Retorna:
+        tuple: (dígito 1, dígito 2).
+    """
+
+    return _calc_digits_ascii(clean_cnpj.encode('ascii'))
+
+
+def _calc_digits_ascii(ascii_cnpj: bytes) -> Tuple[int, int]:
+    """
+    Calcular os dois dígitos verificadores a partir dos códigos ASCII.
+
+    Trabalha direto sobre um buffer de bytes (ex: uma linha uint8 de um
+    array ou um registro lido em modo binário), sem decodificar para str.
+
+    Parâmetros:
+        ascii_cnpj (bytes ou bytearray): CNPJ limpo em ASCII (ao menos
+                                         os 12 primeiros caracteres).
+
+    Retorna:
+        tuple: (dígito 1, dígito 2).
+    """
+
+    # Converter o CNPJ pela tabela uma única vez
+    values = ascii_cnpj.translate(_CHAR_VALUES)
+
+    # Calcular primeiro dígito verificador
+    total = _weighted_sum1(values)
+    digit1 = _CHECK_DIGIT[total]
+
+    # Calcular segundo dígito verificador reaproveitando a primeira soma:
+    # os pesos do segundo são os do primeiro + 1, exceto na posição 4
+    # (2 em vez de 9 + 1, ou seja, -8); o dígito 1 tem peso 2
+    total += sum(values[:12]) - 8 * values[4] + digit1 * 2
+    digit2 = _CHECK_DIGIT[total]
+
+    return digit1, digit2
+
+
+@functools.lru_cache(maxsize=131072)
+def _validate_clean(clean_cnpj: str) -> ValidationResult:
+    """
+    Validar os dígitos verificadores de um CNPJ já limpo (memoizado).
+
+    Parâmetros:
+        clean_cnpj (str): CNPJ limpo, retornado por _validate_input_format.
+
+    Retorna:
+        str: O CNPJ limpo se válido.
+        False: Caso contrário.
+    """
+
+    # Verificar se todos os caracteres são iguais
+    if clean_cnpj in _BLOCKED_CNPJ:
+        logger.debug(
+            "CNPJ rejeitado: todos os caracteres iguais (%s)",
+            clean_cnpj[0]
+        )
+        return False
+
+    # Calcular os dígitos verificadores
+    digit1, digit2 = _calc_digits(clean_cnpj)
+
+    # Verificar se os dígitos calculados correspondem aos dígitos do CNPJ
+    is_valid = (ord(clean_cnpj[12]) - 48 == digit1
+                and ord(clean_cnpj[13]) - 48 == digit2)
+
+    if is_valid:
+        logger.debug("CNPJ validado com sucesso: %s", clean_cnpj)
+        return clean_cnpj
+
+    logger.debug(
+        "CNPJ %s inválido: esperado %s%s, encontrado %s",
+        clean_cnpj, digit1, digit2, clean_cnpj[-2:]
+    )
+    return False
+
+
+@functools.lru_cache(maxsize=131072)
+def _format_clean(clean_cnpj: str) -> str:
+    """
+    Formatar um CNPJ já limpo, sem revalidar (memoizado).
+
+    Parâmetros:
+        clean_cnpj (str): CNPJ limpo (14 caracteres).
+
+    Retorna:
+        str: CNPJ formatado.
+    """
+
+    c = clean_cnpj
+    return f"{c[:2]}.{c[2:5]}.{c[5:8]}/{c[8:12]}-{c[12:]}"
+
+
+def _validate_records(ascii_records: bytes) -> List[bool]:
+    """
+    Validar registros ASCII de 14 posições concatenados em um buffer.
+
+    O buffer inteiro é convertido pela tabela de valores em uma única
+    chamada; cada registro é então conferido com o cálculo fundido dos
+    dois dígitos, sem criar strings por CNPJ.
+
+    Parâmetros:
+        ascii_records (bytes): Registros de 14 bytes (0-9 e A-Z), sem
+                               separadores; o tamanho deve ser múltiplo de 14.
+
+    Retorna:
+        list[bool]: Resultado da validação de cada registro, na mesma ordem.
+    """
+
+    # Converter todos os registros pela tabela em uma única chamada
+    values = ascii_records.translate(_CHAR_VALUES)
+
+    results = []
+    weighted_sum1 = _weighted_sum1
+    for offset in range(0, len(values), 14):
+        record = values[offset:offset + 14]
+
+        # Caracteres fora de 0-9/A-Z ou todos iguais invalidam o registro
+        if _INVALID_CHAR in record or record in _BLOCKED_VALUES:
+            results.append(False)
+            continue
+
+        total = weighted_sum1(record)
+        digit1 = _CHECK_DIGIT[total]
+
+        total += sum(record[:12]) - 8 * record[4] + digit1 * 2
+        digit2 = _CHECK_DIGIT[total]
+
+        results.append(record[12] == digit1 and record[13] == digit2)
+
+    return results
+
+
 class CNPJ:
     """
     Classe para validação de CNPJ.
@@ -35,14 +311,79 @@ class CNPJ:
     """
 
     # Sequências de pesos para cálculo dos dígitos verificadores
-    _SEQUENCE1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    _SEQUENCE2 = [6] + _SEQUENCE1
+    _SEQUENCE1 = _WEIGHTS1
+    _SEQUENCE2 = _WEIGHTS2
+
+    # Somas ponderadas desenroladas para o tamanho fixo do CNPJ
+    _weighted_sum1 = staticmethod(_weighted_sum1)
+    _weighted_sum2 = staticmethod(unrolled_weighted_sum(_SEQUENCE2))
+
+    # Núcleo da validação (funções de módulo)
+    _clean_string = staticmethod(_clean_string)
+    _calc_digits = staticmethod(_calc_digits)
+    _calc_digits_ascii = staticmethod(_calc_digits_ascii)
+    _validate_clean = staticmethod(_validate_clean)
+    _format_clean = staticmethod(_format_clean)
 
     # Configurações da API CNPJws
     _BASE_URL = "https://publica.cnpj.ws/cnpj/" # URL base da API CNPJws
     _API_RATE_LIMIT = 3  # requisições por minuto
     _MIN_INTERVAL = 60 / _API_RATE_LIMIT  # segundos entre requisições
+    _API_BURST = 1  # rajada máxima (a API conta requisições por minuto)
     _MAX_RETRIES = 3  # máximo de tentativas para rate limit
+    _RETRY_BACKOFF_BASE = 1.0  # espera mínima (s) da primeira nova tentativa
+    _RETRY_BACKOFF_MAX = 60.0  # teto (s) do backoff exponencial
+    _RETRY_JITTER_MAX = 2.0  # jitter máximo (s) somado à espera
+
+    # Limitador de taxa compartilhado pelas consultas ao endpoint
+    _RATE_LIMITER = TokenBucket(
+        capacity=_API_BURST, rate_per_sec=1 / _MIN_INTERVAL
+    )
+
+    # Cache de respostas da API (desativado até configure_cache)
+    _CACHE: Optional[ResponseCache] = None
+    _CACHE_TTL = 86400  # segundos para CNPJs encontrados (200)
+    _CACHE_TTL_NOT_FOUND = 3600  # segundos para CNPJs não encontrados (404)
+
+    @staticmethod
+    def configure_cache(
+        path: Optional[str] = None,
+        ttl: float = 86400,
+        ttl_not_found: float = 3600,
+        max_size: int = 4096
+    ) -> None:
+        """
+        Ativar o cache de respostas das consultas à API CNPJws.
+
+        Consultas com resposta ainda válida no cache não fazem requisição
+        nem aguardam o rate limit; respostas expiradas são revalidadas com
+        If-None-Match / If-Modified-Since quando a API envia ETag ou
+        Last-Modified.
+
+        Parâmetros:
+            path (str, opcional): Arquivo SQLite para persistir o cache entre
+                                  execuções; None mantém o cache em memória.
+            ttl (float): Validade em segundos de CNPJs encontrados
+                         (padrão: 1 dia).
+            ttl_not_found (float): Validade em segundos de CNPJs não
+                                   encontrados (padrão: 1 hora).
+            max_size (int): Máximo de CNPJs guardados no cache em memória;
+                            os usados há mais tempo são descartados
+                            (padrão: 4096).
+        """
+
+        CNPJ.disable_cache()
+        CNPJ._CACHE = ResponseCache(path, max_size=max_size)
+        CNPJ._CACHE_TTL = ttl
+        CNPJ._CACHE_TTL_NOT_FOUND = ttl_not_found
+
+    @staticmethod
+    def disable_cache() -> None:
+        """Desativar o cache de respostas (fechando o arquivo, se houver)."""
+
+        if CNPJ._CACHE is not None:
+            CNPJ._CACHE.close()
+            CNPJ._CACHE = None
 
     @staticmethod
     def _character_to_value(character: str) -> int:
@@ -64,11 +405,11 @@ class CNPJ:
             '0'-'9' → 0-9
             'A'-'Z' → 17-42
         """
-        value = ord(character) - 48
+        code = ord(character)
+        value = _CHAR_VALUES[code] if code < 256 else _INVALID_CHAR
 
-        # Valida se o caractere está no intervalo esperado
-        # '0'-'9': 0-9 ou 'A'-'Z': 17-42
-        if not (0 <= value <= 9 or 17 <= value <= 42):
+        # Valida se o caractere está na tabela ('0'-'9' ou 'A'-'Z')
+        if value == _INVALID_CHAR:
             raise CNPJValidationError(
                 f"Caractere inválido: '{character}'",
                 value=character
@@ -93,6 +434,18 @@ class CNPJ:
             CNPJValidationError: Se o CNPJ tiver formato inválido.
         """
 
+        # String primeiro (caso mais comum): pode ser alfanumérico
+        # (resultado memoizado)
+        if isinstance(cnpj, str):
+            # Já limpo (14 caracteres ASCII sem pontuação): dispensa a
+            # limpeza e a consulta ao cache
+            if len(cnpj) == 14 and cnpj.isascii():
+                if cnpj.isdigit():
+                    return cnpj
+                if cnpj.isalnum():
+                    return cnpj.upper()
+            return _clean_string(cnpj)
+
         # Converter para string se for inteiro (apenas numéricos)
         if isinstance(cnpj, int):
             # Validar se é positivo
@@ -114,29 +467,6 @@ class CNPJ:
                 )
             return cnpj_str
 
-        # Se for string, pode ser alfanumérico
-        if isinstance(cnpj, str):
-
-            # Converter para maiúsculas e remover pontuação mas manter alfanuméricos
-            clean_cnpj = re.sub(r'[.\-/\s]', '', cnpj.upper())
-
-            # Verificar se tem 14 caracteres
-            if len(clean_cnpj) != 14:
-                raise CNPJValidationError(
-                    "CNPJ deve ter 14 caracteres "
-                    "(letras A-Z ou números 0-9).",
-                    value=cnpj,
-                )
-
-            # Verificar se todos são alfanuméricos (A-Z ou 0-9)
-            if not re.match(r'^[A-Z0-9]{14}$', clean_cnpj):
-                raise CNPJValidationError(
-                    "CNPJ deve conter apenas letras (A-Z) e números (0-9).",
-                    value=cnpj,
-                )
-
-            return clean_cnpj
-
         raise CNPJValidationError(
             "CNPJ deve ser string ou inteiro.",
             value=cnpj
@@ -159,22 +489,25 @@ class CNPJ:
 
         # Definir sequência de pesos com base no comprimento do partial_cnpj
         if len(partial_cnpj) == 12:
-            sequence = CNPJ._SEQUENCE1
+            weighted_sum = CNPJ._weighted_sum1
         elif len(partial_cnpj) == 13:
-            sequence = CNPJ._SEQUENCE2
+            weighted_sum = CNPJ._weighted_sum2
         else:
             raise CNPJValidationError(
                 "CNPJ parcial deve ter 12 ou 13 dígitos.",
                 value=partial_cnpj
             )
 
+        # Converter todos os caracteres de uma vez pela tabela (em C)
+        values = partial_cnpj.encode('ascii', 'replace').translate(_CHAR_VALUES)
+        if _INVALID_CHAR in values:
+            # Localizar o caractere inválido para a mensagem de erro
+            for character in partial_cnpj:
+                CNPJ._character_to_value(character)
+
         # Calcular o dígito verificador
-        total = sum(
-            CNPJ._character_to_value(digit) * weight
-            for digit, weight in zip(partial_cnpj, sequence)
-        )
-        remainder = total % 11
-        return 0 if remainder < 2 else 11 - remainder
+        total = weighted_sum(values)
+        return _CHECK_DIGIT[total]
 
     @staticmethod
     def _extract_and_wait_for_release(error_message: str) -> float:
@@ -189,21 +522,8 @@ class CNPJ:
             CNPJAPIError: Se não for possível extrair a data.
         """
 
-        # Padrão regex para capturar a data no formato da mensagem
-        # (Quebrado em várias linhas usando re.VERBOSE)
-        pattern = re.compile(
-            r"""
-            ([A-Z][a-z]{2}\s+      # Dia da semana (ex: Mon)
-             [A-Z][a-z]{2}\s+      # Mês (ex: Oct)
-             \d{2}\s+              # Dia (ex: 27)
-             \d{4}\s+              # Ano (ex: 2025)
-             \d{2}:\d{2}:\d{2})    # Hora (ex: 14:30:00)
-             \s+GMT                # Literal " GMT"
-             ([+-]\d{4})           # Timezone offset (ex: -0300)
-            """,
-            re.VERBOSE
-        )
-        match = re.search(pattern, error_message)
+        # Capturar a data no formato da mensagem
+        match = _RELEASE_RE.search(error_message)
 
         if not match:
             raise CNPJAPIError(
@@ -215,28 +535,20 @@ class CNPJ:
         date_str = match.group(1)
         timezone_str = match.group(2)  # Ex: "-0300"
 
-        # Criar objeto de fuso horário a partir da string de offset
-        # Ex: -0300 -> offset de -3 horas
-        tz_offset = timedelta(
-            hours=int(timezone_str[:3]),
-            minutes=int(timezone_str[0] + timezone_str[3:])
-        )
-        tz = timezone(tz_offset)
-        # Parsear a data e aplicar o fuso horário
-        # Formato: "Mon Oct 27 2025 14:30:00"
-        release_date_aware = datetime.strptime(
-            date_str,
-            "%a %b %d %Y %H:%M:%S"
-        )
-        release_date_aware = release_date_aware.replace(tzinfo=tz)
+        # Parsear a data por posição, já com o fuso horário da mensagem
+        release_date_aware = parse_release_date(date_str, timezone_str)
+        if release_date_aware is None:
+            raise CNPJAPIError(
+                "Não foi possível extrair a data de liberação.",
+                value=error_message
+            )
 
-        # Obter a data/hora local ATUAL, ciente do fuso horário
-        now_local = datetime.now().astimezone()
+        # Comparar com o instante atual em UTC: não depende do fuso local,
+        # evitando a consulta ao tzdata do sistema a cada chamada
+        now_utc = datetime.now(timezone.utc)
 
         # Calcular o tempo de espera em segundos
-        # Isso funciona corretamente mesmo que o servidor e o cliente
-        # estejam em fusos horários diferentes.
-        wait_seconds = (release_date_aware - now_local).total_seconds()
+        wait_seconds = (release_date_aware - now_utc).total_seconds()
 
         if wait_seconds <= 0:
             return 0.0
@@ -247,7 +559,49 @@ class CNPJ:
         logger.info("Rate limit atingido. Aguardando liberação: %sm %ss", minutes, seconds)
         return wait_seconds
 
-    @rate_limited(min_interval=_MIN_INTERVAL)
+    @staticmethod
+    def _retry_delay(server_delay: float, retry_count: int) -> float:
+        """
+        Calcular a espera antes de repetir uma consulta que recebeu 429.
+
+        A espera informada pela API é um piso: se ela subestimar a liberação,
+        o backoff exponencial garante que a próxima tentativa espere mais.
+        O jitter evita que consultas concorrentes voltem todas no mesmo
+        instante.
+
+        Parâmetros:
+            server_delay (float): Espera em segundos informada pela API.
+            retry_count (int): Número de tentativas já realizadas.
+        Retorna:
+            float: Tempo de espera em segundos.
+        """
+
+        backoff = min(
+            CNPJ._RETRY_BACKOFF_BASE * 2 ** retry_count,
+            CNPJ._RETRY_BACKOFF_MAX
+        )
+        delay = max(server_delay, backoff)
+        return delay + random.uniform(
+            0, min(CNPJ._RETRY_JITTER_MAX, delay * 0.1)
+        )
+
+    @staticmethod
+    def _error_details(response: requests.Response) -> Dict[str, Any]:
+        """
+        Ler o corpo JSON de uma resposta de erro da API.
+
+        Parâmetros:
+            response (requests.Response): Resposta 404 ou 429 da API.
+        Retorna:
+            dict: Corpo da resposta; se não for JSON (ex: página HTML de um
+                  proxy), {'detalhes': <início do texto>}.
+        """
+
+        try:
+            return response.json()
+        except ValueError:
+            return {'detalhes': response.text[:200]}
+
     @staticmethod
     def _investigate_cnpj(
         cnpj: str,
@@ -283,37 +637,85 @@ class CNPJ:
             )
             return None
         
+        # Respostas ainda válidas no cache dispensam a requisição
+        # (e a ficha do limitador de taxa)
+        cache = CNPJ._CACHE
+        cached = cache.get(cnpj) if cache is not None else None
+        if cached is not None and cached.fresh:
+            logger.debug("CNPJ %s obtido do cache", cnpj)
+            return cached.data
+
+        # Entrada expirada: revalidar condicionalmente (ETag/Last-Modified)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        # Aguardar uma ficha do limitador de taxa
+        CNPJ._RATE_LIMITER.acquire()
+
         # Fazer a requisição GET
         try:
-            response = requests.get(CNPJ._BASE_URL + cnpj, timeout=timeout)
-            # Tentar parsear JSON mesmo em caso de erro,
-            # pois a API retorna detalhes
-            response_info = response.json()
+            response = _SESSION.get(
+                CNPJ._BASE_URL + cnpj, timeout=timeout, headers=headers or None
+            )
+            status_code = response.status_code
 
-            # Verificar o código de status
-            if response.status_code == 200:
+            # Verificar o código de status antes de decodificar o JSON,
+            # que só é lido nos casos em que o corpo é utilizado
+            if status_code == 200:
                 logger.info("CNPJ %s encontrado com sucesso", cnpj)
+                response_info = response.json()
+                if cache is not None:
+                    cache.set(
+                        cnpj, response_info, CNPJ._CACHE_TTL,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified'),
+                    )
                 return response_info
 
-            if response.status_code == 404:
+            if status_code == 304 and cached is not None:
+                # Não modificado: renovar a validade da entrada
+                logger.debug("CNPJ %s não modificado; cache renovado", cnpj)
+                cache.set(
+                    cnpj, cached.data, CNPJ._CACHE_TTL,
+                    etag=cached.etag, last_modified=cached.last_modified,
+                )
+                return cached.data
+
+            if status_code in (404, 429):
+                response_info = CNPJ._error_details(response)
+
+            if status_code == 404:
                 logger.warning(
                     "CNPJ %s não encontrado: %s",
                     cnpj,
                     response_info.get('detalhes', 'Sem detalhes')
                 )
+                if cache is not None:
+                    cache.set(cnpj, None, CNPJ._CACHE_TTL_NOT_FOUND)
                 return None  # Retorna None especificamente para 404
 
-            if response.status_code == 429:
+            if status_code == 429:
                 logger.warning("Rate limit atingido para CNPJ %s", cnpj)
 
-                # Extrair e aguardar liberação
-                wait_for_release = CNPJ._extract_and_wait_for_release(
-                    response_info.get('detalhes', '')
+                # Usar o cabeçalho Retry-After; a mensagem é apenas fallback
+                wait_for_release = parse_retry_after(
+                    response.headers.get('Retry-After')
+                )
+                if wait_for_release is None:
+                    wait_for_release = CNPJ._extract_and_wait_for_release(
+                        response_info.get('detalhes', '')
+                    )
+
+                # Bloquear o limitador compartilhado até a liberação (com
+                # backoff exponencial e jitter): a nova tentativa e as demais
+                # consultas em andamento aguardam em acquire()
+                CNPJ._RATE_LIMITER.drain(
+                    CNPJ._retry_delay(wait_for_release, retry_count)
                 )
-
-                if wait_for_release > 0:
-                # Aguardar tempo necessário para liberação
-                    time.sleep(wait_for_release)
 
                 return CNPJ._investigate_cnpj(
                     cnpj,
@@ -321,10 +723,10 @@ class CNPJ:
                     retry_count=retry_count + 1
                 )
 
-            if response.status_code not in (200, 404, 429):
+            if status_code not in (200, 304, 404, 429):
                 logger.error(
                     "Erro inesperado ao consultar CNPJ %s. Status: %s",
-                    cnpj, response.status_code
+                    cnpj, status_code
                 )
                 # Levanta um erro genérico do requests para outros status
                 response.raise_for_status()
@@ -372,6 +774,97 @@ class CNPJ:
         return CNPJ._investigate_cnpj(validated_cnpj, timeout=timeout)
 
 
+    @staticmethod
+    def investigate_many(
+        cnpjs: Iterable[CnpjInput],
+        concurrency: int = 3,
+        timeout: int = 10
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Consultar vários CNPJs via API CNPJws, aguardando todos os resultados.
+
+        Versão síncrona de `investigate_many_async`, com a mesma convenção
+        de chamada de CNPJValidator.investigate_many; dentro de um loop de
+        eventos, use `await CNPJ.investigate_many_async(...)`.
+
+        Parâmetros:
+            cnpjs (iterável de str ou int): CNPJs a serem consultados.
+            concurrency (int): Máximo de consultas simultâneas (padrão: 3).
+            timeout (int): Tempo máximo de espera por resposta em segundos
+                           (padrão: 10).
+        Retorna:
+            list: Resultado de `investigate` para cada CNPJ, na mesma ordem
+                  (None para CNPJs inválidos ou não encontrados).
+        Levanta:
+            CNPJAPIError: Para erros de comunicação com a API.
+            RuntimeError: Se chamado com um loop de eventos em execução.
+        """
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Sem loop em execução: rodar a versão assíncrona até o fim
+            return asyncio.run(
+                CNPJ.investigate_many_async(cnpjs, concurrency, timeout)
+            )
+        raise RuntimeError(
+            "investigate_many não pode ser chamado dentro de um loop de "
+            "eventos; use await CNPJ.investigate_many_async(...)."
+        )
+
+    @staticmethod
+    async def investigate_many_async(
+        cnpjs: Iterable[CnpjInput],
+        concurrency: int = 3,
+        timeout: int = 10
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Consultar vários CNPJs via API CNPJws de forma assíncrona (corrotina).
+
+        As consultas rodam em threads do executor padrão e compartilham o
+        limitador de taxa da classe: o limite de 3 requisições/minuto continua
+        respeitado, mas conexão, resposta e parsing de uma consulta se
+        sobrepõem à espera pela próxima.
+
+        Parâmetros:
+            cnpjs (iterável de str ou int): CNPJs a serem consultados.
+            concurrency (int): Máximo de consultas simultâneas (padrão: 3).
+            timeout (int): Tempo máximo de espera por resposta em segundos
+                           (padrão: 10).
+        Retorna:
+            list: Resultado de `investigate` para cada CNPJ, na mesma ordem
+                  (None para CNPJs inválidos ou não encontrados). CNPJs
+                  repetidos são consultados uma única vez.
+        Levanta:
+            CNPJAPIError: Para erros de comunicação com a API.
+        """
+
+        # Validar todos os CNPJs antes de iniciar as consultas
+        validated_cnpjs = [CNPJ.validate(cnpj) for cnpj in cnpjs]
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def lookup(validated_cnpj: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        CNPJ._investigate_cnpj, validated_cnpj, timeout=timeout
+                    )
+                )
+
+        # Consultar cada CNPJ distinto uma única vez: repetições no lote
+        # não gastam a cota da API
+        unique_cnpjs = list(dict.fromkeys(
+            cnpj for cnpj in validated_cnpjs if cnpj
+        ))
+        found = dict(zip(unique_cnpjs, await asyncio.gather(
+            *(lookup(cnpj) for cnpj in unique_cnpjs)
+        )))
+
+        return [found[cnpj] if cnpj else None for cnpj in validated_cnpjs]
+
     @staticmethod
     def find_matrix(branch_cnpj: CnpjInput) -> str:
         """
@@ -399,18 +892,22 @@ class CNPJ:
                 value=branch_cnpj
             )
 
+        # Já é a matriz: os dígitos verificadores acabaram de ser conferidos
+        if cnpj[8:12] == '0001':
+            return CNPJ._format_clean(cnpj)
+
         # Extrair a parte do CNPJ que identifica a empresa (8 primeiros dígitos)
         partial_matrix_cnpj = cnpj[:8] + '0001'
 
         # Calcular os dígitos verificadores para o CNPJ da matriz
-        digit1 = CNPJ._calculate_digit(partial_matrix_cnpj)
-        digit2 = CNPJ._calculate_digit(partial_matrix_cnpj + str(digit1))
+        digit1, digit2 = _calc_digits(partial_matrix_cnpj)
 
         # Montar o CNPJ completo da matriz
-        matrix_cnpj = partial_matrix_cnpj + f"{digit1}{digit2}"
+        matrix_cnpj = partial_matrix_cnpj + chr(48 + digit1) + chr(48 + digit2)
 
         logger.debug("Matriz de %s: %s", branch_cnpj, matrix_cnpj)
-        return CNPJ.format(matrix_cnpj)
+        # O CNPJ já está limpo: formatar sem revalidar
+        return CNPJ._format_clean(matrix_cnpj)
 
     @staticmethod
     def validate(cnpj: CnpjInput) -> ValidationResult:
@@ -425,39 +922,107 @@ class CNPJ:
             False: Caso contrário.
         """
 
-        # Validar formato do CNPJ
+        # Validar formato do CNPJ (entradas já limpas dispensam a limpeza)
         try:
             clean_cnpj = CNPJ._validate_input_format(cnpj)
         except CNPJValidationError:
             logger.debug("CNPJ rejeitado: formato inválido.")
             return False
 
-        # Verificar se todos os caracteres são iguais
-        if clean_cnpj == clean_cnpj[0] * len(clean_cnpj):
-            logger.debug(
-                "CNPJ rejeitado: todos os caracteres iguais (%s)",
-                clean_cnpj[0]
-            )
-            return False
+        return _validate_clean(clean_cnpj)
 
-        # Calcular primeiro dígito verificador
-        digit1 = CNPJ._calculate_digit(clean_cnpj[:12])
+    @staticmethod
+    def validate_batch(cnpjs: Iterable[CnpjInput]) -> List[bool]:
+        """
+        Validar vários CNPJs (numéricos ou alfanuméricos) em lote.
 
-        # Calcular segundo dígito verificador
-        digit2 = CNPJ._calculate_digit(clean_cnpj[:12] + str(digit1))
+        Os CNPJs bem formados são concatenados em um único buffer ASCII,
+        convertido pela tabela de valores de uma só vez; cada registro de
+        14 posições é então verificado sobre esse buffer.
 
-        # Verificar se os dígitos calculados correspondem aos dígitos do CNPJ
-        is_valid = clean_cnpj[-2:] == f"{digit1}{digit2}"
+        Parâmetros:
+            cnpjs (iterável de str ou int): CNPJs a serem validados.
 
-        if is_valid:
-            logger.debug("CNPJ validado com sucesso: %s", clean_cnpj)
-            return clean_cnpj
+        Retorna:
+            list[bool]: Resultado da validação de cada CNPJ, na mesma ordem.
+            CNPJs com formato inválido resultam em False, sem levantar erro.
+        """
 
-        logger.debug(
-            "CNPJ %s inválido: esperado %s%s, encontrado %s",
-            clean_cnpj, digit1, digit2, clean_cnpj[-2:]
-        )
-        return False
+        # Limpar as entradas, separando as bem formadas
+        results = []
+        positions = []
+        clean_list = []
+        for cnpj in cnpjs:
+            if isinstance(cnpj, str):
+                # Limpar como bytes; fora do caminho rápido, remover também
+                # os espaços Unicode (o que sobrar fora do ASCII é inválido)
+                try:
+                    clean_cnpj = cnpj.encode('ascii').translate(
+                        None, _STRIP_BYTES).upper()
+                except UnicodeEncodeError:
+                    clean_cnpj = b''
+                if len(clean_cnpj) != 14:
+                    text = _strip_all(cnpj)
+                    clean_cnpj = (text.encode('ascii').upper()
+                                  if text.isascii() else b'')
+            elif isinstance(cnpj, int) and cnpj >= 0:
+                clean_cnpj = str(cnpj).zfill(14).encode('ascii')
+            else:
+                clean_cnpj = b''
+
+            results.append(False)
+            if len(clean_cnpj) == 14 and clean_cnpj.isalnum():
+                positions.append(len(results) - 1)
+                clean_list.append(clean_cnpj)
+
+        # Validar os registros bem formados em um único buffer ASCII
+        records = b''.join(clean_list)
+        for position, is_valid in zip(positions, _validate_records(records)):
+            results[position] = is_valid
+
+        return results
+
+    @staticmethod
+    def validate_buffer(buffer: bytes) -> List[bool]:
+        """
+        Validar CNPJs armazenados como registros ASCII de largura fixa.
+
+        Aceita qualquer objeto com protocolo de buffer (bytes, bytearray,
+        memoryview, ou um array NumPy de dtype 'S14'), sem converter cada
+        CNPJ em str: útil para lotes lidos de arquivos de largura fixa.
+
+        Parâmetros:
+            buffer (bytes-like): Registros de 14 caracteres (0-9 e A-Z
+                                 maiúsculos), concatenados sem separadores.
+
+        Retorna:
+            list[bool]: Resultado da validação de cada registro, na mesma
+            ordem. Registros com caracteres inválidos resultam em False.
+
+        Raises:
+            CNPJValidationError: Se o argumento não for bytes-like (ex: um
+                                 inteiro, que bytes() transformaria em um
+                                 buffer de zeros) ou se o tamanho do buffer
+                                 não for múltiplo de 14.
+        """
+
+        # Aceitar apenas objetos com protocolo de buffer
+        try:
+            records = bytes(memoryview(buffer))
+        except TypeError as e:
+            raise CNPJValidationError(
+                "Buffer deve ser um objeto bytes-like "
+                "(bytes, bytearray ou memoryview).",
+                value=type(buffer).__name__
+            ) from e
+
+        if len(records) % 14:
+            raise CNPJValidationError(
+                "Buffer deve conter registros de 14 caracteres.",
+                value=len(records)
+            )
+
+        return _validate_records(records)
 
     @staticmethod
     def format(cnpj: CnpjInput) -> str:
@@ -474,5 +1039,4 @@ class CNPJ:
         """
 
         # Validar formato do CNPJ e retornar formatado
-        cnpj = CNPJ._validate_input_format(cnpj)
-        return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+        return CNPJ._format_clean(CNPJ._validate_input_format(cnpj))
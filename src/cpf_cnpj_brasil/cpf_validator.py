@@ -1,7 +1,68 @@
 """
 Classe para validação de CPF (Cadastro de Pessoas Físicas).
 """
-import re
+import functools
+
+# Tabelas, pesos e cálculo dos dígitos compartilhados com a classe CPF,
+# para que as duas interfaces usem uma única implementação
+from ._cpf_core import (
+    _BLOCKED_CPF,
+    _CHECK_DIGIT,
+    _DIGIT_VALUES,
+    _STRIP_TABLE,
+    _WEIGHTS1,
+    _WEIGHTS2,
+    _calc_digits_ascii,
+    _weighted_sum1,
+    _weighted_sum2,
+)
+
+
+@functools.lru_cache(maxsize=65536)
+def _clean_cpf(cpf: str) -> str:
+    """
+    Limpa e valida o formato de um CPF em string (memoizado).
+
+    Parâmetros:
+        cpf (str): CPF com ou sem formatação.
+
+    Retorna:
+        str: Os 11 dígitos numéricos do CPF.
+
+    Raises:
+        ValueError: Se o CPF tiver formato inválido.
+    """
+
+    # Remover pontuação e espaços; qualquer outro caractere invalida o CPF
+    numeric_digits = cpf.translate(_STRIP_TABLE)
+
+    # Verificar se tem 11 dígitos, todos numéricos (ASCII)
+    if len(numeric_digits) != 11 or not numeric_digits.isascii() or not numeric_digits.isdigit():
+        raise ValueError(
+            "CPF com formato inválido. Deve ser uma string de 11 dígitos numéricos ou um inteiro.")
+    return numeric_digits
+
+
+@functools.lru_cache(maxsize=65536)
+def _check_digits(cpf: str) -> bool:
+    """
+    Confere os dígitos verificadores de um CPF já limpo (memoizado).
+
+    Parâmetros:
+        cpf (str): CPF limpo (11 dígitos).
+
+    Retorna:
+        bool: True se válido, False caso contrário.
+    """
+
+    # Verificar se todos os dígitos são iguais
+    if cpf in _BLOCKED_CPF:
+        return False
+
+    # Comparar os códigos ASCII dos dígitos do CPF com os calculados
+    ascii_cpf = cpf.encode('ascii')
+    digit1, digit2 = _calc_digits_ascii(ascii_cpf)
+    return ascii_cpf[9] == 48 + digit1 and ascii_cpf[10] == 48 + digit2
 
 
 class CPFValidator:
@@ -9,9 +70,10 @@ class CPFValidator:
     Classe para validação de CPF.
     """
 
-    def __init__(self):
-        self.sequence1 = [10, 9, 8, 7, 6, 5, 4, 3, 2]
-        self.sequence2 = [11] + self.sequence1
+    # Sequências de pesos para cálculo dos dígitos verificadores
+    # (tuplas compartilhadas pela classe, sem alocação por instância)
+    sequence1 = _WEIGHTS1
+    sequence2 = _WEIGHTS2
 
     @staticmethod
     def _validate_input_format(cpf):
@@ -32,14 +94,13 @@ class CPFValidator:
         if isinstance(cpf, int):
             cpf = str(cpf).zfill(11)
 
-        # Extrair dígitos numéricos
-        numeric_digits = re.sub(r'\D', '', cpf)
-
-        # Verificar se tem 11 dígitos, todos numéricos e é string
-        if not isinstance(numeric_digits, str) or len(numeric_digits) != 11 or not numeric_digits.isdigit():
+        # Verificar se é string antes de limpar
+        if not isinstance(cpf, str):
             raise ValueError(
                 "CPF com formato inválido. Deve ser uma string de 11 dígitos numéricos ou um inteiro.")
-        return numeric_digits
+
+        # Limpar e validar o formato (resultado memoizado)
+        return _clean_cpf(cpf)
 
     def _calculate_digit(self, partial_cpf):
         """
@@ -55,19 +116,20 @@ class CPFValidator:
             ValueError: Se as entradas forem incompatíveis.
         """
 
-        # Definir sequência de pesos com base no comprimento do partial_cpf
+        # Definir a soma ponderada com base no comprimento do partial_cpf
         if len(partial_cpf) == 9:
-            sequence = self.sequence1
+            weighted_sum = _weighted_sum1
         elif len(partial_cpf) == 10:
-            sequence = self.sequence2
+            weighted_sum = _weighted_sum2
         else:
             raise ValueError("CPF parcial deve ter 9 ou 10 dígitos.")
 
-        # Calcular o dígito verificador
-        total = sum(int(digit) * weight for digit,
-                   weight in zip(partial_cpf, sequence))
-        remainder = total % 11
-        return 0 if remainder < 2 else 11 - remainder
+        if not (partial_cpf.isascii() and partial_cpf.isdigit()):
+            raise ValueError(f"Caractere inválido em: '{partial_cpf}'")
+
+        # Converter os dígitos uma única vez e somar com os pesos
+        total = weighted_sum(partial_cpf.encode('ascii').translate(_DIGIT_VALUES))
+        return _CHECK_DIGIT[total]
 
     @staticmethod
     def format_cpf(cpf):
@@ -96,18 +158,5 @@ class CPFValidator:
             bool: True se válido, False caso contrário.
         """
 
-        # Validar formato do CPF
-        cpf = self._validate_input_format(cpf)
-
-        # Verificar se todos os dígitos são iguais
-        if cpf == cpf[0] * len(cpf):
-            return False  # CPF com todos os dígitos iguais é inválido
-
-        # Calcular primeiro dígito verificador
-        digit1 = self._calculate_digit(cpf[:9])
-
-        # Calcular segundo dígito verificador
-        digit2 = self._calculate_digit(cpf[:9] + str(digit1))
-
-        # Verificar se os dígitos calculados correspondem aos dígitos do CPF
-        return cpf[-2:] == f"{digit1}{digit2}"
+        # Validar formato do CPF e conferir os dígitos (resultado memoizado)
+        return _check_digits(self._validate_input_format(cpf))
@@ -1,10 +1,21 @@
 """Utilitários para validação de CPF (Cadastro de Pessoas Físicas)."""
 
-import re
+import functools
 import logging
-from typing import Union, Literal
+from typing import Iterable, List, Union, Literal
 
 from .exceptions import CPFValidationError
+from ._cpf_core import (
+    _BLOCKED_CPF,
+    _CHECK_DIGIT,
+    _DIGIT_VALUES,
+    _STRIP_TABLE,
+    _WEIGHTS1,
+    _WEIGHTS2,
+    _calc_digits_ascii,
+    _weighted_sum1,
+    _weighted_sum2,
+)
 
 # Configurar logging
 logger = logging.getLogger(__name__)
@@ -14,6 +25,90 @@ CpfInput = Union[str, int]
 ValidationResult = Union[str, Literal[False]]
 
 
+# Limpeza e validação em funções de módulo memoizadas; a classe CPF as
+# expõe como métodos estáticos.
+@functools.lru_cache(maxsize=65536)
+def _clean_string(cpf: str) -> str:
+    """
+    Limpa e valida o formato de um CPF em string (memoizado).
+
+    Parâmetros:
+        cpf (str): CPF com ou sem formatação.
+
+    Retorna:
+        str: Os 11 dígitos numéricos do CPF.
+
+    Raises:
+        CPFValidationError: Se o CPF tiver formato inválido.
+    """
+    # Remover pontuação e espaços; qualquer outro caractere invalida o CPF
+    numeric_digits = cpf.translate(_STRIP_TABLE)
+
+    if (len(numeric_digits) != 11 or not numeric_digits.isascii()
+            or not numeric_digits.isdigit()):
+        raise CPFValidationError(
+            "CPF com formato inválido. "
+            "Inteiro deve ter no máximo 11 dígitos.",
+            value=cpf,
+        )
+    return numeric_digits
+
+
+@functools.lru_cache(maxsize=65536)
+def _validate_clean(clean_cpf: str) -> ValidationResult:
+    """
+    Valida os dígitos verificadores de um CPF já limpo (memoizado).
+
+    Parâmetros:
+        clean_cpf (str): CPF limpo, retornado por _validate_input_format.
+
+    Retorna:
+        str: O CPF limpo se válido.
+        False: Caso contrário.
+    """
+
+    # Verificar se todos os dígitos são iguais (ex: 111.111.111-11)
+    if clean_cpf in _BLOCKED_CPF:
+        logger.debug(
+            "CPF rejeitado: todos os dígitos iguais (%s)",
+            clean_cpf[0]
+        )
+        return False
+
+    # Calcular os dígitos verificadores
+    ascii_cpf = clean_cpf.encode('ascii')
+    digit1, digit2 = _calc_digits_ascii(ascii_cpf)
+
+    # Verificar se os dígitos calculados correspondem aos dígitos do CPF,
+    # comparando os códigos ASCII sem formatar os inteiros como string
+    is_valid = ascii_cpf[9] == 48 + digit1 and ascii_cpf[10] == 48 + digit2
+
+    if is_valid:
+        logger.debug("CPF validado com sucesso: %s", clean_cpf)
+        return clean_cpf
+
+    logger.debug(
+        "CPF %s inválido: esperado %s%s, encontrado %s",
+        clean_cpf, digit1, digit2, clean_cpf[-2:]
+    )
+    return False
+
+
+@functools.lru_cache(maxsize=65536)
+def _format_clean(clean_cpf: str) -> str:
+    """
+    Formata um CPF já limpo, sem revalidar (memoizado).
+
+    Parâmetros:
+        clean_cpf (str): CPF limpo (11 dígitos).
+
+    Retorna:
+        str: CPF formatado.
+    """
+    c = clean_cpf
+    return f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}"
+
+
 class CPF:
     """
     Classe utilitária para validar e formatar números de CPF.
@@ -23,8 +118,14 @@ class CPF:
     """
 
     # Sequências de pesos para cálculo dos dígitos verificadores (PEP 8: Constantes)
-    _SEQUENCE1 = list(range(10, 1, -1)) # de 10 a 2
-    _SEQUENCE2 = list(range(11, 1, -1)) # de 11 a 2
+    _SEQUENCE1 = _WEIGHTS1 # de 10 a 2
+    _SEQUENCE2 = _WEIGHTS2 # de 11 a 2
+
+    # Limpeza e validação memoizadas (funções de módulo)
+    _clean_string = staticmethod(_clean_string)
+    _calc_digits_ascii = staticmethod(_calc_digits_ascii)
+    _validate_clean = staticmethod(_validate_clean)
+    _format_clean = staticmethod(_format_clean)
 
     @staticmethod
     def _validate_input_format(cpf: CpfInput) -> str:
@@ -40,8 +141,16 @@ class CPF:
         Raises:
             CPFValidationError: Se o CPF tiver formato inválido.
         """
-        # Converter para string se for inteiro
-        if isinstance(cpf, int):
+        # String primeiro (caso mais comum): resultado memoizado
+        if isinstance(cpf, str):
+            # Já limpo (11 dígitos ASCII): dispensa a limpeza e o cache
+            if len(cpf) == 11 and cpf.isascii() and cpf.isdigit():
+                return cpf
+            return _clean_string(cpf)
+
+        # Converter para string se for inteiro (bool é subclasse de int,
+        # mas True/False não são CPFs)
+        if isinstance(cpf, int) and not isinstance(cpf, bool):
 
             # Validar se é positivo
             if cpf < 0:
@@ -52,23 +161,20 @@ class CPF:
             
             # Preencher com zeros à esquerda para garantir 11 dígitos
             cpf_str = str(cpf).zfill(11)
-        elif isinstance(cpf, str):
-            cpf_str = cpf
         else:
             raise CPFValidationError(
                 "CPF deve ser string ou inteiro.",
                 value=cpf
             )
 
-        numeric_digits = re.sub(r'\D', '', cpf_str)
-
-        if len(numeric_digits) != 11 or not numeric_digits.isdigit():
+        # Inteiro: apenas verificar o tamanho (já é numérico)
+        if len(cpf_str) != 11:
             raise CPFValidationError(
                 "CPF com formato inválido. "
                 "Inteiro deve ter no máximo 11 dígitos.",
                 value=cpf,
             )
-        return numeric_digits
+        return cpf_str
 
     @staticmethod
     def _calculate_digit(partial_cpf: str) -> int:
@@ -85,24 +191,24 @@ class CPF:
             CPFValidationError: Se o CPF parcial for inválido.
         """
         if len(partial_cpf) == 9:
-            sequence = CPF._SEQUENCE1
+            weighted_sum = _weighted_sum1
         elif len(partial_cpf) == 10:
-            sequence = CPF._SEQUENCE2
+            weighted_sum = _weighted_sum2
         else:
             raise CPFValidationError(
                 "CPF parcial deve ter 9 ou 10 dígitos.",
                 value=partial_cpf
             )
 
-        # Calcular o dígito verificador
-        total = sum(
-            int(digit) * weight
-            for digit, weight in zip(partial_cpf, sequence)
-        )
-        remainder = total % 11
+        if not (partial_cpf.isascii() and partial_cpf.isdigit()):
+            raise CPFValidationError(
+                "CPF parcial deve conter apenas dígitos.",
+                value=partial_cpf
+            )
 
-        print("Total:", total, "Resto:", remainder)  # Linha de depuração
-        return 0 if remainder < 2 else 11 - remainder
+        # Calcular o dígito verificador (soma desenrolada, sem int() por dígito)
+        total = weighted_sum(partial_cpf.encode('ascii').translate(_DIGIT_VALUES))
+        return _CHECK_DIGIT[total]
 
     @staticmethod
     def format(cpf: CpfInput) -> str:
@@ -116,8 +222,60 @@ class CPF:
             str: CPF formatado.
         """
         # Validar formato do CPF e retornar formatado
-        cpf_digits = CPF._validate_input_format(cpf)
-        return f"{cpf_digits[:3]}.{cpf_digits[3:6]}.{cpf_digits[6:9]}-{cpf_digits[9:]}"
+        return _format_clean(CPF._validate_input_format(cpf))
+
+    @staticmethod
+    def validate_batch(cpfs: Iterable[CpfInput]) -> List[bool]:
+        """
+        Valida vários CPFs em lote.
+
+        Os CPFs bem formados são concatenados em um único buffer ASCII,
+        convertido em valores numéricos de uma só vez; cada registro de
+        11 posições é então verificado sobre esse buffer.
+
+        Parâmetros:
+            cpfs (iterável de str | int): CPFs a serem validados.
+
+        Retorna:
+            list[bool]: Resultado da validação de cada CPF, na mesma ordem.
+            CPFs com formato inválido resultam em False, sem levantar erro.
+        """
+
+        # Limpar as entradas, separando as bem formadas
+        results = []
+        positions = []
+        clean_list = []
+        for cpf in cpfs:
+            if isinstance(cpf, str):
+                clean_cpf = cpf.translate(_STRIP_TABLE)
+            elif isinstance(cpf, int) and cpf >= 0:
+                clean_cpf = str(cpf).zfill(11)
+            else:
+                clean_cpf = ''
+
+            results.append(False)
+            if (len(clean_cpf) == 11 and clean_cpf.isascii()
+                    and clean_cpf.isdigit()
+                    and clean_cpf not in _BLOCKED_CPF):
+                positions.append(len(results) - 1)
+                clean_list.append(clean_cpf)
+
+        # Converter todos os registros em valores numéricos de uma só vez
+        values = ''.join(clean_list).encode('ascii').translate(_DIGIT_VALUES)
+
+        for offset, position in zip(range(0, len(values), 11), positions):
+            record = values[offset:offset + 11]
+
+            total = _weighted_sum1(record)
+            digit1 = _CHECK_DIGIT[total]
+
+            # Os pesos do segundo dígito são os do primeiro + 1
+            total += sum(record[:9]) + digit1 * 2
+            digit2 = _CHECK_DIGIT[total]
+
+            results[position] = record[9] == digit1 and record[10] == digit2
+
+        return results
 
     @staticmethod
     def validate(cpf: CpfInput) -> ValidationResult:
@@ -132,35 +290,11 @@ class CPF:
             False: Caso contrário.
         """
 
-        # Validar formato do CPF
+        # Validar formato do CPF (entradas já limpas dispensam a limpeza)
         try:
             clean_cpf = CPF._validate_input_format(cpf)
         except CPFValidationError:
             logger.debug("CPF rejeitado: formato inválido.")
             return False
 
-        # Verificar se todos os dígitos são iguais (ex: 111.111.111-11)
-        if clean_cpf == clean_cpf[0] * len(clean_cpf):
-            logger.debug(
-                "CPF rejeitado: todos os dígitos iguais (%s)",
-                clean_cpf[0]
-            )
-            return False
-
-        # Calcular primeiro dígito verificador
-        digit1 = CPF._calculate_digit(clean_cpf[:9])
-        # Calcular segundo dígito verificador
-        digit2 = CPF._calculate_digit(clean_cpf[:9] + str(digit1))
-
-        # Verificar se os dígitos calculados correspondem aos dígitos do CPF
-        is_valid = clean_cpf[-2:] == f"{digit1}{digit2}"
-
-        if is_valid:
-            logger.debug("CPF validado com sucesso: %s", clean_cpf)
-            return clean_cpf
-
-        logger.debug(
-            "CPF %s inválido: esperado %s%s, encontrado %s",
-            clean_cpf, digit1, digit2, clean_cpf[-2:]
-        )
-        return False
+        return _validate_clean(clean_cpf)
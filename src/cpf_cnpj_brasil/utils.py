@@ -1,15 +1,35 @@
-"""Utilitários auxiliares para validação de CNPJ."""
+"""
+Utilitários compartilhados pelos validadores: limitadores de taxa, política
+de novas tentativas HTTP, leitura das datas de liberação da API e geração
+das tabelas e somas dos dígitos verificadores.
+"""
 import threading
 import functools
-from typing import Callable, Any
+import warnings
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Any, Dict, Optional, Sequence
 import time
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 
 def rate_limited(min_interval: float) -> Callable:
     """
     Decorator para garantir um intervalo mínimo entre chamadas de função.
+
+    Obsoleto: os validadores usam TokenBucket, que permite rajadas e o
+    bloqueio até a liberação informada pela API; prefira
+    TokenBucket(capacity=1, rate_per_sec=1 / min_interval).acquire().
+
+    O intervalo é contado entre os inícios das chamadas, de modo que
+    funções lentas não alongam a cadência.
     
     Thread-safe: Suporta uso em ambientes multi-threading.
+
+    Pode ser aplicado acima ou abaixo de @staticmethod/@classmethod: o
+    descritor é desembrulhado e recriado em volta da função limitada.
     
     Parâmetros:
         min_interval (float): Intervalo mínimo em segundos entre chamadas.
@@ -17,32 +37,252 @@ def rate_limited(min_interval: float) -> Callable:
     Retorna:
         Callable: Função decorada com controle de taxa.
     """
+    warnings.warn(
+        "rate_limited está obsoleto e será removido; use TokenBucket.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
     def decorator(func: Callable) -> Callable:
-        # Armazena o timestamp da última execução COMPLETA
-        last_call_end = [0.0]  # Lista para permitir mutação em closure
+        # Desembrulhar staticmethod/classmethod para limitar a função real
+        if isinstance(func, (staticmethod, classmethod)):
+            return type(func)(decorator(func.__func__))
+
+        # Próximo horário liberado (lista para permitir mutação em closure)
+        next_deadline = [0.0]
 
         # Lock para garantir thread-safety
         lock = threading.Lock()
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            with lock:  # Garante que apenas uma thread execute por vez
-                current_time = time.time()
-                time_since_last = current_time - last_call_end[0]
-
-                # Se necessário, aguarda para respeitar o intervalo mínimo
-                if time_since_last < min_interval:
-                    wait_time = min_interval - time_since_last
-                    time.sleep(wait_time)
-
-            try:
-                # Executa a função (fora do lock para permitir I/O)
-                result = func(*args, **kwargs)
-                return result
-            finally:
-                # Atualiza o timestamp APÓS a execução
-                with lock:
-                    last_call_end[0] = time.time()
+            # Reservar o horário sob lock, uma única vez por chamada; a
+            # agenda avança pela cadência pretendida, não pelo fim da função
+            with lock:
+                now = time.monotonic()
+                deadline = max(next_deadline[0], now)
+                next_deadline[0] = deadline + min_interval
+
+            # Aguardar e executar fora do lock para permitir I/O concorrente
+            wait_time = deadline - now
+            if wait_time > 0:
+                time.sleep(wait_time)
+            return func(*args, **kwargs)
 
         return wrapper
     return decorator
+
+
+class TokenBucket:
+    """
+    Limitador de taxa do tipo token bucket.
+
+    Acumula fichas continuamente até a capacidade; cada chamada consome uma
+    ficha e só aguarda quando o balde está vazio, permitindo rajadas dentro
+    da cota sem esperas desnecessárias entre chamadas espaçadas.
+
+    O saldo é guardado como o instante (time.monotonic_ns) em que a próxima
+    ficha estará livre, em nanossegundos inteiros: uma leitura do relógio
+    por chamada, sem aritmética de ponto flutuante e imune a ajustes do
+    relógio do sistema.
+
+    Thread-safe: a reserva da ficha é feita sob lock e a espera, fora dele.
+
+    Parâmetros:
+        capacity (int): Número máximo de fichas acumuladas (tamanho da rajada).
+        rate_per_sec (float): Fichas repostas por segundo.
+    """
+
+    def __init__(self, capacity: int, rate_per_sec: float) -> None:
+        self.capacity = capacity
+        self.rate_per_sec = rate_per_sec
+        self._interval_ns = round(1_000_000_000 / rate_per_sec)
+        # Quanto o próximo horário livre pode estar no futuro sem espera
+        self._burst_ns = (capacity - 1) * self._interval_ns
+        self._next_free_ns = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Consome uma ficha, aguardando a reposição se necessário.
+
+        Retorna:
+            float: Tempo aguardado em segundos (0 se havia ficha disponível).
+        """
+        with self._lock:
+            now = time.monotonic_ns()
+
+            # Reservar a ficha; o horário livre avança mesmo quando é
+            # preciso aguardar, enfileirando as threads seguintes
+            next_free = max(self._next_free_ns, now)
+            self._next_free_ns = next_free + self._interval_ns
+            wait_ns = next_free - now - self._burst_ns
+            if wait_ns <= 0:
+                return 0.0
+
+        # Aguardar fora do lock para não bloquear as demais threads
+        wait_time = wait_ns / 1e9
+        time.sleep(wait_time)
+        return wait_time
+
+    def drain(self, seconds: float) -> None:
+        """
+        Esvazia o balde para que nenhuma ficha seja liberada antes do prazo.
+
+        Parâmetros:
+            seconds (float): Segundos até a próxima liberação (ex: o
+                             Retry-After informado pela API).
+        """
+        with self._lock:
+            release = time.monotonic_ns() + round(seconds * 1e9) + self._burst_ns
+            self._next_free_ns = max(self._next_free_ns, release)
+
+
+def retrying_adapter(pool_maxsize: int = 8) -> HTTPAdapter:
+    """
+    Cria o adapter HTTP com a política de novas tentativas dos validadores.
+
+    O adapter só repete falhas de conexão e erros transitórios de gateway
+    (502, 503, 504), no máximo 2 vezes, com backoff exponencial. Essas
+    tentativas acontecem dentro de uma única chamada a Session.get, fora do
+    limitador de taxa: são poucas e não contam como novas consultas. O 429
+    é tratado pelos validadores (cota da API) e, esgotadas as tentativas, a
+    última resposta 5xx é devolvida normalmente, sem RetryError, para que o
+    código de status continue sendo informado.
+
+    Parâmetros:
+        pool_maxsize (int): Conexões mantidas por host (padrão: 8).
+
+    Retorna:
+        HTTPAdapter: Adapter pronto para Session.mount.
+    """
+    return HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+
+
+# Meses em inglês (formato fixo da mensagem da API, independe do locale)
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+
+def parse_release_date(date_str: str, timezone_str: str) -> Optional[datetime]:
+    """
+    Interpreta a data de liberação das mensagens de rate limit da API.
+
+    O formato é fixo, então a data é lida por posição, sem strptime nem
+    dependência do locale.
+
+    Parâmetros:
+        date_str (str): Data no formato "Mon Oct 27 2025 14:30:00".
+        timezone_str (str): Deslocamento do fuso horário (ex: "-0300").
+
+    Retorna:
+        datetime: Data de liberação, ciente do fuso horário.
+        None: Se a data for inválida.
+    """
+    try:
+        _, month_str, day_str, year_str, time_str = date_str.split()
+        offset = timedelta(
+            hours=int(timezone_str[1:3]), minutes=int(timezone_str[3:5])
+        )
+        if timezone_str[0] == '-':
+            offset = -offset
+        return datetime(
+            int(year_str), _MONTHS[month_str], int(day_str),
+            int(time_str[0:2]), int(time_str[3:5]), int(time_str[6:8]),
+            tzinfo=timezone(offset)
+        )
+    except (KeyError, ValueError, IndexError):
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Interpreta o valor do cabeçalho HTTP Retry-After.
+
+    Aceita tanto a forma em segundos ("120") quanto a forma de data HTTP
+    ("Wed, 21 Oct 2015 07:28:00 GMT").
+
+    Parâmetros:
+        value (str, opcional): Valor do cabeçalho Retry-After.
+
+    Retorna:
+        float: Segundos a aguardar (0 se a data já passou).
+        None: Se o cabeçalho estiver ausente ou for inválido.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+
+    # Forma em segundos
+    if value.isdigit():
+        return float(value)
+
+    # Forma de data HTTP
+    try:
+        release_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if release_date.tzinfo is None:
+        release_date = release_date.replace(tzinfo=timezone.utc)
+
+    wait_seconds = (release_date - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, wait_seconds)
+
+
+def mod11_digit_table(max_total: int) -> bytes:
+    """
+    Gera a tabela soma ponderada -> dígito verificador (módulo 11).
+
+    O dígito é 11 - (soma % 11), ou 0 quando o resto é menor que 2; com a
+    tabela, o cálculo vira uma única indexação, sem módulo nem desvio.
+
+    Parâmetros:
+        max_total (int): Maior soma ponderada possível.
+
+    Retorna:
+        bytes: Tabela indexada pela soma (0 a max_total).
+    """
+    return bytes(
+        (remainder >= 2) * (11 - remainder)
+        for remainder in (total % 11 for total in range(max_total + 1))
+    )
+
+
+def unrolled_weighted_sum(weights: Sequence[int]) -> Callable[[Sequence[int]], int]:
+    """
+    Gera uma função que calcula a soma ponderada com os pesos fixados.
+
+    A soma é montada como uma única expressão desenrolada
+    (ex: ``v[0] * 5 + v[1] * 4 + ...``), sem laço, zip ou indexação dos
+    pesos em tempo de execução, pois o tamanho e os pesos são constantes.
+
+    Parâmetros:
+        weights (sequência de int): Pesos aplicados a cada posição.
+
+    Retorna:
+        Callable: Função que recebe os valores (ex: bytes) e retorna
+                  sum(values[i] * weights[i]).
+    """
+    terms = " + ".join(
+        f"v[{index}] * {int(weight)}" for index, weight in enumerate(weights)
+    )
+
+    # Código gerado apenas a partir de índices e pesos inteiros, executado
+    # em um namespace próprio, sem acesso aos globais do módulo
+    source = f"def weighted_sum(v):\n    return {terms}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<unrolled_weighted_sum>", "exec"), namespace)
+    return namespace["weighted_sum"]
@@ -0,0 +1,297 @@
+"""Testes unitários para a classe legada CNPJValidator."""
+from unittest.mock import patch, Mock
+import pytest
+
+from cpf_cnpj_brasil.cnpj_validator import CNPJValidator
+
+
+@pytest.fixture
+def validator():
+    """Validador com a sessão HTTP simulada e sem esperas reais."""
+    instance = CNPJValidator()
+    with patch.object(instance._session, 'get') as mock_get, \
+            patch('time.sleep') as mock_sleep:
+        instance.mock_get = mock_get
+        instance.mock_sleep = mock_sleep
+        yield instance
+    instance.close()
+
+
+def _response(status_code, data=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = data
+    response.headers = headers or {}
+    return response
+
+
+class TestCNPJValidatorValidate:
+    """Testes para os métodos validate_cnpj e validate_many."""
+
+    def test_validar_cnpj_valido(self, validator):
+        """Testa CNPJ numérico válido, com e sem formatação."""
+        assert validator.validate_cnpj("11.222.333/0001-81") is True
+        assert validator.validate_cnpj(11222333000181) is True
+
+    def test_validar_cnpj_alfanumerico(self, validator):
+        """Testa CNPJ alfanumérico válido."""
+        assert validator.validate_cnpj("12.abc.345/01de-35") is True
+
+    def test_validar_cnpj_com_espacos_unicode(self, validator):
+        """Testa que espaços Unicode (NBSP, U+2003, '\\x1c') são removidos."""
+        assert validator.validate_cnpj("11.222.333/0001-81\u00a0") is True
+        assert validator.validate_cnpj("11\u2003222\u2003333\u20030001\u200381") is True
+        assert validator.format_cnpj("12ABC34501DE35\x1c") == "12.ABC.345/01DE-35"
+        assert validator.validate_many(["11.222.333/0001-81\u00a0"]) == [True]
+
+    def test_validar_cnpj_digito_errado(self, validator):
+        """Testa CNPJ com dígito verificador errado."""
+        assert validator.validate_cnpj("11222333000182") is False
+
+    def test_validar_cnpj_formato_invalido(self, validator):
+        """Testa que formato inválido levanta ValueError."""
+        with pytest.raises(ValueError):
+            validator.validate_cnpj("123")
+
+    def test_validar_lote_misto(self, validator):
+        """Testa lote com CNPJs válidos, inválidos e mal formados."""
+        cnpjs = [
+            "11.222.333/0001-81",
+            11222333000181,
+            "12ABC34501DE35",
+            "11222333000182",
+            "123",
+            "ÀBC34501DE3512",
+            None,
+            -1,
+        ]
+        assert validator.validate_many(cnpjs) == [
+            True, True, True, False, False, False, False, False
+        ]
+
+    def test_validar_lote_vazio(self, validator):
+        """Testa lote vazio."""
+        assert validator.validate_many([]) == []
+
+    def test_validar_cnpj_todos_iguais(self, validator):
+        """Testa que CNPJ com todos os caracteres iguais é inválido."""
+        assert validator.validate_cnpj("00000000000000") is False
+        assert validator.validate_cnpj("AAAAAAAAAAAAAA") is False
+        assert validator.validate_many(["00000000000000", "11111111111111"]) == [
+            False, False
+        ]
+
+
+class TestCNPJValidatorFindHeadquarters:
+    """Testes para o método find_headquarters."""
+
+    def test_encontrar_matriz_de_filial(self, validator):
+        """Testa encontrar a matriz a partir de uma filial válida."""
+        assert validator.find_headquarters("11222333000262") == "11.222.333/0001-81"
+
+    def test_encontrar_matriz_ja_eh_matriz(self, validator):
+        """Testa que a matriz é devolvida formatada."""
+        assert validator.find_headquarters(11222333000181) == "11.222.333/0001-81"
+
+    def test_encontrar_matriz_alfanumerica(self, validator):
+        """Testa matriz de CNPJ alfanumérico."""
+        result = validator.find_headquarters("12ABC34501DE35")
+        assert result == "12.ABC.345/0001-88"
+        assert validator.validate_cnpj(result) is True
+
+    def test_encontrar_matriz_cnpj_invalido(self, validator):
+        """Testa que filial com dígito errado levanta ValueError."""
+        with pytest.raises(ValueError) as excinfo:
+            validator.find_headquarters("11222333000263")
+        assert "inválido" in str(excinfo.value).lower()
+
+
+class TestCNPJValidatorSession:
+    """Testes para a sessão HTTP reutilizada entre consultas."""
+
+    def test_politica_de_novas_tentativas(self):
+        """Testa que a sessão devolve a última resposta 5xx, sem RetryError."""
+        validator = CNPJValidator()
+        retries = validator._session.get_adapter(validator._base_url).max_retries
+        assert retries.total == 2
+        assert retries.raise_on_status is False
+        assert set(retries.status_forcelist) == {502, 503, 504}
+        assert 429 not in retries.status_forcelist
+        validator.close()
+
+    def test_close_encerra_sessao(self):
+        """Testa que close fecha a sessão HTTP."""
+        validator = CNPJValidator()
+        with patch.object(validator._session, 'close') as mock_close:
+            validator.close()
+        mock_close.assert_called_once()
+
+    def test_gerenciador_de_contexto(self):
+        """Testa que o bloco with devolve o validador e fecha a sessão."""
+        validator = CNPJValidator()
+        with patch.object(validator._session, 'close') as mock_close:
+            with validator as context:
+                assert context is validator
+                mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+
+class TestCNPJValidatorInvestigate:
+    """Testes para os métodos investigate e investigate_many."""
+
+    def test_investigate_cnpj_encontrado(self, validator):
+        """Testa consulta de CNPJ encontrado na API."""
+        validator.mock_get.return_value = _response(
+            200, {"razao_social": "Empresa Teste LTDA"}
+        )
+
+        result = validator.investigate("11.222.333/0001-81")
+
+        assert result == {"razao_social": "Empresa Teste LTDA"}
+        args, kwargs = validator.mock_get.call_args
+        assert args[0].endswith("/11222333000181")
+        assert kwargs["timeout"] == 10
+
+    def test_investigate_cnpj_nao_encontrado(self, validator, capsys):
+        """Testa consulta de CNPJ não encontrado (404)."""
+        validator.mock_get.return_value = _response(
+            404, {"titulo": "Não encontrado", "detalhes": "CNPJ inexistente"}
+        )
+
+        assert validator.investigate("11222333000181") is None
+        assert "Não encontrado. CNPJ inexistente." in capsys.readouterr().out
+
+    def test_investigate_erro_servidor_informa_status(self, validator, capsys):
+        """Testa que um 5xx devolvido pela sessão é informado pelo status."""
+        validator.mock_get.return_value = _response(503)
+
+        assert validator.investigate("11222333000181") is None
+        assert "Status code: 503" in capsys.readouterr().out
+
+    def test_investigate_rate_limit_esvazia_limitador(self, validator):
+        """Testa que o 429 esvazia o token bucket até o Retry-After."""
+        validator.mock_get.return_value = _response(
+            429,
+            {"titulo": "Muitas requisições", "detalhes": "Aguarde"},
+            {"Retry-After": "30"},
+        )
+
+        with patch.object(validator, '_drain_rate_limit') as mock_drain:
+            assert validator.investigate("11222333000181") is None
+        mock_drain.assert_called_once_with(30.0)
+
+    def test_investigate_rate_limit_bloqueia_proxima_consulta(self, validator):
+        """Testa que, após o 429, a consulta seguinte aguarda a liberação."""
+        validator.mock_get.return_value = _response(
+            429,
+            {"titulo": "Muitas requisições", "detalhes": "Aguarde"},
+            {"Retry-After": "30"},
+        )
+        validator.investigate("11222333000181")
+        validator.mock_sleep.assert_not_called()
+
+        validator.mock_get.return_value = _response(200, {"cnpj": "11444777000161"})
+        validator.investigate("11444777000161")
+        validator.mock_sleep.assert_called_once()
+        assert validator.mock_sleep.call_args[0][0] >= 29
+
+    def test_investigate_many_mantem_ordem(self, validator):
+        """Testa que os resultados seguem a ordem da entrada."""
+        validator.mock_get.side_effect = lambda url, timeout: _response(
+            200, {"cnpj": url[-14:]}
+        )
+
+        result = validator.investigate_many(
+            ["34028316000103", "11.444.777/0001-61", 11222333000181]
+        )
+
+        assert result == [
+            {"cnpj": "34028316000103"},
+            {"cnpj": "11444777000161"},
+            {"cnpj": "11222333000181"},
+        ]
+
+    def test_investigate_many_remove_duplicados(self, validator):
+        """Testa que CNPJs repetidos são consultados uma única vez."""
+        validator.mock_get.side_effect = lambda url, timeout: _response(
+            200, {"cnpj": url[-14:]}
+        )
+
+        result = validator.investigate_many(
+            ["11222333000181", "11.444.777/0001-61", 11222333000181]
+        )
+
+        assert result == [
+            {"cnpj": "11222333000181"},
+            {"cnpj": "11444777000161"},
+            {"cnpj": "11222333000181"},
+        ]
+        assert validator.mock_get.call_count == 2
+
+    def test_investigate_many_formato_invalido(self, validator):
+        """Testa que formato inválido levanta ValueError antes das consultas."""
+        with pytest.raises(ValueError):
+            validator.investigate_many(["11222333000181", "123"])
+        validator.mock_get.assert_not_called()
+
+
+class TestCNPJValidatorCache:
+    """Testes para o cache em memória de investigate."""
+
+    def test_resposta_em_cache(self, validator):
+        """Testa que a segunda consulta é servida pelo cache."""
+        validator.mock_get.return_value = _response(200, {"cnpj": "11222333000181"})
+
+        first = validator.investigate("11222333000181")
+        second = validator.investigate("11.222.333/0001-81")
+
+        assert first == second == {"cnpj": "11222333000181"}
+        assert validator.mock_get.call_count == 1
+
+    def test_nao_encontrado_em_cache(self, validator):
+        """Testa que o 404 também é armazenado."""
+        validator.mock_get.return_value = _response(
+            404, {"titulo": "Não encontrado", "detalhes": "CNPJ inexistente"}
+        )
+
+        assert validator.investigate("11222333000181") is None
+        assert validator.investigate("11222333000181") is None
+        assert validator.mock_get.call_count == 1
+
+    def test_entrada_expirada(self, validator):
+        """Testa que, vencido o TTL, a consulta volta à API."""
+        validator._cache_ttl = 0
+        validator.mock_get.return_value = _response(200, {"cnpj": "11222333000181"})
+
+        validator.investigate("11222333000181")
+        validator.investigate("11222333000181")
+
+        assert validator.mock_get.call_count == 2
+
+    def test_resultado_alterado_nao_corrompe_cache(self, validator):
+        """Testa que alterar a resposta devolvida não altera o cache."""
+        validator.mock_get.return_value = _response(
+            200, {"cnpj": "11222333000181", "socios": []}
+        )
+
+        validator.investigate("11222333000181")["socios"].append("alterado")
+        validator.investigate("11222333000181")["socios"].append("alterado")
+
+        assert validator.investigate("11222333000181")["socios"] == []
+        assert validator.mock_get.call_count == 1
+
+    def test_limite_de_tamanho_descarta_mais_antigo(self, validator):
+        """Testa que o cache descarta a entrada usada há mais tempo."""
+        validator._cache_max_size = 2
+        validator.mock_get.return_value = _response(200, {"cnpj": "qualquer"})
+
+        validator.investigate("11222333000181")
+        validator.investigate("11444777000161")
+        validator.investigate("11222333000181")  # Renova o uso do primeiro
+        validator.investigate("34028316000103")  # Descarta o segundo
+        assert validator.mock_get.call_count == 3
+
+        validator.investigate("11222333000181")
+        assert validator.mock_get.call_count == 3
+        validator.investigate("11444777000161")
+        assert validator.mock_get.call_count == 4
@@ -1,9 +1,13 @@
 """Testes unitários para o módulo CNPJ."""
+import asyncio
+import random
+from datetime import datetime, timezone
 from unittest.mock import patch, Mock
 import pytest
 
 from cpf_cnpj_brasil.cnpj_validator_gemini import CNPJ
 from cpf_cnpj_brasil.exceptions import CNPJValidationError, CNPJAPIError
+from cpf_cnpj_brasil.utils import TokenBucket, rate_limited
 
 
 class TestCNPJCharacterToValue:
@@ -83,11 +87,34 @@ class TestCNPJValidateInputFormat:
         result = CNPJ._validate_input_format("abc12345000195")
         assert result == "ABC12345000195"
 
+    def test_cnpj_unicode_expandido_em_maiusculas_invalido(self):
+        """Testa que caracteres que upper() expande (ex: 'ﬀ') são rejeitados."""
+        with pytest.raises(CNPJValidationError):
+            CNPJ._validate_input_format("11222333ﬀ018")
+        assert CNPJ.validate_batch(["11222333ﬀ018"]) == [False]
+
+    def test_cnpj_digitos_unicode_invalido(self):
+        """Testa que dígitos não ASCII (ex: '１') não passam pelo caminho rápido."""
+        with pytest.raises(CNPJValidationError):
+            CNPJ._validate_input_format("１１２２２３３３０００１８１")
+
     def test_cnpj_alfanumerico_formatado(self):
         """Testa CNPJ alfanumérico formatado."""
         result = CNPJ._validate_input_format("AB.C12.345/0001-95")
         assert result == "ABC12345000195"
 
+    def test_cnpj_com_espacos_unicode(self):
+        """Testa que espaços Unicode (NBSP, U+2003, '\\x1c') são removidos."""
+        assert CNPJ._validate_input_format(
+            "11.222.333/0001-81\u00a0") == "11222333000181"
+        assert CNPJ._validate_input_format(
+            "11\u2003222\u2003333\u20030001\u200381") == "11222333000181"
+        assert CNPJ._validate_input_format(
+            "12abc34501de35\x1c") == "12ABC34501DE35"
+        assert CNPJ.validate("11.222.333/0001-81\u00a0") == "11222333000181"
+        assert CNPJ.validate_batch(
+            ["11.222.333/0001-81\u00a0", "12abc34501de35\x1c"]) == [True, True]
+
     # CNPJs inválidos - formato
     def test_cnpj_string_com_menos_de_14_caracteres(self):
         """Testa CNPJ string com menos de 14 caracteres."""
@@ -119,6 +146,12 @@ class TestCNPJValidateInputFormat:
             CNPJ._validate_input_format("123456@8000195")
         assert "apenas letras" in str(excinfo.value).lower()
 
+    def test_cnpj_com_digitos_nao_ascii(self):
+        """Testa que dígitos Unicode fora do ASCII são rejeitados."""
+        with pytest.raises(CNPJValidationError) as excinfo:
+            CNPJ._validate_input_format("١١٢٢٢٣٣٣٠٠٠١٨١")
+        assert "apenas letras" in str(excinfo.value).lower()
+
     def test_cnpj_tipo_invalido(self):
         """Testa CNPJ com tipo inválido (não string nem inteiro)."""
         with pytest.raises(CNPJValidationError) as excinfo:
@@ -188,6 +221,13 @@ class TestCNPJCalculateDigit:
         result = CNPJ._calculate_digit("000000000006")
         assert result == 0
 
+    def test_digitos_a_partir_de_bytes(self):
+        """Testa o cálculo sobre buffers ASCII (bytes e bytearray)."""
+        assert CNPJ._calc_digits_ascii(b"112223330001") == (8, 1)
+        assert CNPJ._calc_digits_ascii(bytearray(b"112223330001")) == (8, 1)
+        assert CNPJ._calc_digits_ascii(b"12ABC34501DE") == \
+            CNPJ._calc_digits("12ABC34501DE")
+
 
 class TestCNPJFormat:
     """Testes para o método format."""
@@ -335,6 +375,85 @@ class TestCNPJValidate:
         result = CNPJ.validate("              ")
         assert result is False
 
+    def test_validar_cnpj_limpo_dispensa_limpeza(self):
+        """Testa que CNPJ já limpo não passa pela limpeza memoizada."""
+        with patch(
+            'cpf_cnpj_brasil.cnpj_validator_gemini._clean_string',
+            return_value="11222333000181"
+        ) as mock_clean:
+            assert CNPJ.validate("11222333000181") == "11222333000181"
+            assert CNPJ.validate("11.222.333/0001-81") == "11222333000181"
+        assert mock_clean.call_count == 1
+
+
+class TestCNPJValidateBatch:
+    """Testes para o método validate_batch."""
+
+    def test_lote_misto(self):
+        """Testa lote com CNPJs válidos, inválidos e mal formados."""
+        cnpjs = [
+            "11.222.333/0001-81",
+            11222333000181,
+            "11222333000182",
+            "00000000000000",
+            "123",
+            None,
+            -1,
+        ]
+        assert CNPJ.validate_batch(cnpjs) == [
+            True, True, False, False, False, False, False
+        ]
+
+    def test_lote_vazio(self):
+        """Testa lote vazio."""
+        assert CNPJ.validate_batch([]) == []
+
+    def test_equivale_a_validate(self):
+        """Testa que o lote concorda com validate item a item."""
+        cnpjs = ["12ABC34501DE35", "12ABC34501DE36", "11222333000262", "ÀBC"]
+        assert CNPJ.validate_batch(cnpjs) == [
+            bool(CNPJ.validate(cnpj)) for cnpj in cnpjs
+        ]
+
+    def test_lote_aleatorio_equivale_a_validate(self):
+        """Testa lote e buffer contra validate em 10 mil CNPJs aleatórios."""
+        rng = random.Random(1603)
+        cnpjs = []
+        for _ in range(10000):
+            base = ''.join(rng.choice('0123456789AZ') for _ in range(12))
+            digits = CNPJ._calc_digits(base)
+            if rng.random() < 0.5:
+                digits = (digits[0], (digits[1] + 1) % 10)
+            cnpjs.append(base + ''.join(map(str, digits)))
+
+        expected = [bool(CNPJ.validate(cnpj)) for cnpj in cnpjs]
+        assert CNPJ.validate_batch(cnpjs) == expected
+        assert CNPJ.validate_buffer(''.join(cnpjs).encode('ascii')) == expected
+
+    def test_buffer_registros_invalidos(self):
+        """Testa buffer com registros mal formados ou repetidos."""
+        buffer = b"11222333000181" b"11.222.333/0-8" b"abc12345000195" + b"0" * 14
+        assert CNPJ.validate_buffer(bytearray(buffer)) == [
+            True, False, False, False
+        ]
+
+    def test_buffer_tamanho_invalido(self):
+        """Testa buffer cujo tamanho não é múltiplo de 14."""
+        with pytest.raises(CNPJValidationError):
+            CNPJ.validate_buffer(b"1122233300018")
+
+    def test_buffer_tipo_invalido(self):
+        """Testa que argumentos sem protocolo de buffer são rejeitados."""
+        for value in (14, 28, "11222333000181", None, [1, 2]):
+            with pytest.raises(CNPJValidationError) as excinfo:
+                CNPJ.validate_buffer(value)
+            assert "bytes-like" in str(excinfo.value)
+
+    def test_buffer_memoryview(self):
+        """Testa buffer recebido como memoryview."""
+        buffer = memoryview(b"11222333000181" b"11222333000182")
+        assert CNPJ.validate_buffer(buffer) == [True, False]
+
 
 class TestCNPJFindMatrix:
     """Testes para o método find_matrix."""
@@ -376,10 +495,78 @@ class TestCNPJFindMatrix:
             assert "-" in result
 
 
+class TestCNPJRateLimiter:
+    """Testes para o limitador de taxa (token bucket)."""
+
+    def test_primeira_chamada_nao_aguarda(self):
+        """Testa que o balde cheio libera a chamada sem espera."""
+        bucket = TokenBucket(capacity=1, rate_per_sec=1 / 20)
+        with patch('time.sleep') as mock_sleep:
+            assert bucket.acquire() == 0.0
+        mock_sleep.assert_not_called()
+
+    def test_balde_vazio_aguarda_reposicao(self):
+        """Testa que o balde vazio aguarda o tempo de uma ficha."""
+        bucket = TokenBucket(capacity=1, rate_per_sec=1 / 20)
+        with patch('time.sleep') as mock_sleep:
+            bucket.acquire()
+            wait_time = bucket.acquire()
+        assert 19.9 < wait_time <= 20.0
+        mock_sleep.assert_called_once_with(wait_time)
+
+    def test_rajada_dentro_da_capacidade(self):
+        """Testa que chamadas até a capacidade não aguardam."""
+        bucket = TokenBucket(capacity=3, rate_per_sec=1 / 20)
+        with patch('time.sleep') as mock_sleep:
+            waits = [bucket.acquire() for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+        mock_sleep.assert_not_called()
+
+    def test_reservas_enfileiradas(self):
+        """Testa que chamadas simultâneas reservam horários sucessivos."""
+        bucket = TokenBucket(capacity=1, rate_per_sec=1 / 20)
+        with patch('time.monotonic_ns', return_value=10**12), \
+                patch('time.sleep'):
+            waits = [bucket.acquire() for _ in range(3)]
+        assert waits == [0.0, 20.0, 40.0]
+
+    def test_drain_bloqueia_ate_liberacao(self):
+        """Testa que drain adia a próxima ficha até o prazo informado."""
+        bucket = TokenBucket(capacity=3, rate_per_sec=1)
+        with patch('time.monotonic_ns', return_value=10**12), \
+                patch('time.sleep'):
+            bucket.drain(30)
+            assert bucket.acquire() == 30.0
+
+    def test_rate_limited_acima_de_staticmethod(self):
+        """Testa que o decorator preserva o staticmethod e limita as chamadas."""
+        with pytest.warns(DeprecationWarning):
+            class Cliente:
+                @rate_limited(min_interval=20)
+                @staticmethod
+                def consultar(valor):
+                    return valor
+
+        with patch('time.sleep') as mock_sleep:
+            assert Cliente.consultar(1) == 1
+            assert Cliente().consultar(2) == 2
+        assert isinstance(Cliente.__dict__['consultar'], staticmethod)
+        mock_sleep.assert_called_once()
+
+
 class TestCNPJInvestigate:
     """Testes para os métodos investigate e _investigate_cnpj."""
 
-    @patch('cpf_cnpj_brasil.cnpj_validator_gemini.requests.get')
+    @pytest.fixture(autouse=True)
+    def _limitador_novo(self):
+        """Isola o limitador de taxa entre os testes."""
+        bucket = TokenBucket(
+            capacity=CNPJ._API_BURST, rate_per_sec=1 / CNPJ._MIN_INTERVAL
+        )
+        with patch.object(CNPJ, '_RATE_LIMITER', bucket):
+            yield
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
     def test_investigate_cnpj_encontrado(self, mock_get):
         """Testa consulta de CNPJ encontrado na API."""
         mock_response = Mock()
@@ -394,7 +581,7 @@ class TestCNPJInvestigate:
         assert result is not None
         assert result["razao_social"] == "Empresa Teste LTDA"
 
-    @patch('cpf_cnpj_brasil.cnpj_validator_gemini.requests.get')
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
     def test_investigate_cnpj_nao_encontrado(self, mock_get):
         """Testa consulta de CNPJ não encontrado (404)."""
         mock_response = Mock()
@@ -407,11 +594,12 @@ class TestCNPJInvestigate:
         result = CNPJ.investigate("11222333000181")
         assert result is None
 
-    @patch('cpf_cnpj_brasil.cnpj_validator_gemini.requests.get')
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
     def test_investigate_cnpj_rate_limit(self, mock_get):
         """Testa comportamento com rate limit (429)."""
         mock_response = Mock()
         mock_response.status_code = 429
+        mock_response.headers = {}
         mock_response.json.return_value = {
             "detalhes": "Rate limit. Tente após Mon Oct 27 2025 14:30:00 GMT-0300"
         }
@@ -424,7 +612,62 @@ class TestCNPJInvestigate:
             # Após múltiplas tentativas com 429, deve retornar None
             assert result is None or isinstance(result, dict)
 
-    @patch('cpf_cnpj_brasil.cnpj_validator_gemini.requests.get')
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_investigate_rate_limit_usa_retry_after(self, mock_get):
+        """Testa que o cabeçalho Retry-After dispensa a leitura da mensagem."""
+        rate_limited_response = Mock()
+        rate_limited_response.status_code = 429
+        rate_limited_response.headers = {"Retry-After": "5"}
+        rate_limited_response.json.return_value = {"detalhes": "Sem data"}
+        ok_response = Mock()
+        ok_response.status_code = 200
+        ok_response.json.return_value = {"razao_social": "Empresa Teste LTDA"}
+        mock_get.side_effect = [rate_limited_response, ok_response]
+
+        bucket = TokenBucket(capacity=100, rate_per_sec=1)
+        with patch.object(CNPJ, '_RATE_LIMITER', bucket), \
+                patch('time.sleep') as mock_sleep, \
+                patch.object(CNPJ, '_extract_and_wait_for_release') as mock_extract:
+            result = CNPJ.investigate("11222333000181", timeout=1)
+
+        assert result["razao_social"] == "Empresa Teste LTDA"
+        mock_extract.assert_not_called()
+        # Espera do servidor + jitter de até 10%, feita pelo limitador
+        mock_sleep.assert_called_once()
+        assert 5.0 <= mock_sleep.call_args[0][0] <= 5.5
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_rate_limit_bloqueia_limitador_compartilhado(self, mock_get):
+        """Testa que o 429 esvazia o limitador usado pelas demais consultas."""
+        rate_limited_response = Mock()
+        rate_limited_response.status_code = 429
+        rate_limited_response.headers = {"Retry-After": "30"}
+        rate_limited_response.json.return_value = {"detalhes": "Sem data"}
+        mock_get.return_value = rate_limited_response
+
+        bucket = TokenBucket(capacity=100, rate_per_sec=1)
+        with patch.object(CNPJ, '_RATE_LIMITER', bucket), \
+                patch.object(bucket, 'drain', wraps=bucket.drain) as mock_drain, \
+                patch('time.sleep'):
+            assert CNPJ.investigate("11222333000181", timeout=1) is None
+
+        assert mock_drain.call_count == CNPJ._MAX_RETRIES
+        assert all(call[0][0] >= 30.0 for call in mock_drain.call_args_list)
+
+    def test_retry_delay_backoff_exponencial(self):
+        """Testa que o backoff cresce quando o servidor subestima a espera."""
+        delays = [CNPJ._retry_delay(0.0, attempt) for attempt in range(3)]
+
+        assert 1.0 <= delays[0] <= 1.1
+        assert 2.0 <= delays[1] <= 2.2
+        assert 4.0 <= delays[2] <= 4.4
+
+    def test_retry_delay_respeita_servidor_e_teto(self):
+        """Testa que a espera do servidor prevalece e o backoff tem teto."""
+        assert 30.0 <= CNPJ._retry_delay(30.0, 0) <= 32.0
+        assert 60.0 <= CNPJ._retry_delay(0.0, 20) <= 62.0
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
     def test_investigate_erro_ssl(self, mock_get):
         """Testa erro SSL na API."""
         import requests
@@ -434,7 +677,7 @@ class TestCNPJInvestigate:
             CNPJ._investigate_cnpj("11222333000181")
         assert "erro na api" in str(excinfo.value).lower()
 
-    @patch('cpf_cnpj_brasil.cnpj_validator_gemini.requests.get')
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
     def test_investigate_timeout(self, mock_get):
         """Testa timeout na API."""
         import requests
@@ -444,7 +687,7 @@ class TestCNPJInvestigate:
             CNPJ._investigate_cnpj("11222333000181", timeout=1)
         assert "erro na api" in str(excinfo.value).lower()
 
-    @patch('cpf_cnpj_brasil.cnpj_validator_gemini.requests.get')
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
     def test_investigate_connection_error(self, mock_get):
         """Testa erro de conexão com a API."""
         import requests
@@ -455,6 +698,91 @@ class TestCNPJInvestigate:
             CNPJ._investigate_cnpj("11222333000181")
         assert "erro na api" in str(excinfo.value).lower()
 
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_investigate_erro_5xx_sem_json(self, mock_get):
+        """Testa que 5xx com corpo HTML vira erro HTTP sem decodificar JSON."""
+        import requests
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.raise_for_status.side_effect = \
+            requests.exceptions.HTTPError("503 Service Unavailable")
+        mock_get.return_value = mock_response
+
+        with pytest.raises(CNPJAPIError) as excinfo:
+            CNPJ._investigate_cnpj("11222333000181")
+        assert "503" in str(excinfo.value)
+        mock_response.json.assert_not_called()
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_investigate_404_sem_json(self, mock_get):
+        """Testa 404 com corpo que não é JSON."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.json.side_effect = ValueError("not json")
+        mock_response.text = "<html>Not Found</html>"
+        mock_get.return_value = mock_response
+
+        assert CNPJ._investigate_cnpj("11222333000181") is None
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_investigate_many_preserva_ordem(self, mock_get):
+        """Testa consulta em lote: ordem preservada e inválidos como None."""
+        def fake_get(url, timeout, headers=None):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"cnpj": url.rsplit('/', 1)[-1]}
+            return response
+        mock_get.side_effect = fake_get
+
+        with patch('time.sleep'):
+            result = asyncio.run(CNPJ.investigate_many_async(
+                ["11.222.333/0001-81", "00000000000000", 11222333000262]
+            ))
+
+        assert result == [
+            {"cnpj": "11222333000181"}, None, {"cnpj": "11222333000262"}
+        ]
+        assert mock_get.call_count == 2
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_investigate_many_consulta_repetidos_uma_vez(self, mock_get):
+        """Testa que CNPJs repetidos no lote geram uma única requisição."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"cnpj": "11222333000181"}
+        mock_get.return_value = mock_response
+
+        with patch('time.sleep'):
+            result = asyncio.run(CNPJ.investigate_many_async(
+                ["11.222.333/0001-81", 11222333000181, "11222333000181"]
+            ))
+
+        assert result == [{"cnpj": "11222333000181"}] * 3
+        assert mock_get.call_count == 1
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_investigate_many_sincrono(self, mock_get):
+        """Testa que investigate_many roda as consultas e devolve a lista."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"cnpj": "11222333000181"}
+        mock_get.return_value = mock_response
+
+        with patch('time.sleep'):
+            result = CNPJ.investigate_many(["11.222.333/0001-81", "123"])
+
+        assert result == [{"cnpj": "11222333000181"}, None]
+        assert mock_get.call_count == 1
+
+    def test_investigate_many_dentro_de_loop(self):
+        """Testa que a versão síncrona recusa um loop de eventos ativo."""
+        async def consultar():
+            return CNPJ.investigate_many(["11222333000181"])
+
+        with pytest.raises(RuntimeError) as excinfo:
+            asyncio.run(consultar())
+        assert "investigate_many_async" in str(excinfo.value)
+
     def test_investigate_cnpj_invalido(self):
         """Testa investigação com CNPJ inválido."""
         result = CNPJ.investigate("11111111111111")
@@ -466,6 +794,114 @@ class TestCNPJInvestigate:
         assert result is None
 
 
+class TestCNPJCache:
+    """Testes para o cache de respostas de investigate."""
+
+    @pytest.fixture(autouse=True)
+    def _isolamento(self):
+        """Isola limitador de taxa e cache entre os testes."""
+        bucket = TokenBucket(capacity=100, rate_per_sec=1)
+        with patch.object(CNPJ, '_RATE_LIMITER', bucket):
+            yield
+        CNPJ.disable_cache()
+
+    @staticmethod
+    def _response(status_code, data=None, headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.json.return_value = data
+        response.headers = headers or {}
+        return response
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_sem_cache_por_padrao(self, mock_get):
+        """Testa que, sem configure_cache, toda consulta vai à API."""
+        mock_get.return_value = self._response(200, {"cnpj": "11222333000181"})
+        CNPJ.investigate("11222333000181")
+        CNPJ.investigate("11222333000181")
+        assert mock_get.call_count == 2
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_resposta_em_cache(self, mock_get):
+        """Testa que a segunda consulta é servida pelo cache."""
+        CNPJ.configure_cache()
+        mock_get.return_value = self._response(200, {"cnpj": "11222333000181"})
+
+        first = CNPJ.investigate("11222333000181")
+        second = CNPJ.investigate("11.222.333/0001-81")
+
+        assert first == second == {"cnpj": "11222333000181"}
+        assert mock_get.call_count == 1
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_nao_encontrado_em_cache(self, mock_get):
+        """Testa que o 404 também é armazenado."""
+        CNPJ.configure_cache()
+        mock_get.return_value = self._response(404, {"detalhes": "Não encontrado"})
+
+        assert CNPJ.investigate("11222333000181") is None
+        assert CNPJ.investigate("11222333000181") is None
+        assert mock_get.call_count == 1
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_revalidacao_condicional(self, mock_get):
+        """Testa que a entrada expirada é revalidada com If-None-Match."""
+        CNPJ.configure_cache(ttl=0)
+        mock_get.side_effect = [
+            self._response(200, {"cnpj": "11222333000181"}, {"ETag": '"v1"'}),
+            self._response(304),
+        ]
+
+        CNPJ.investigate("11222333000181")
+        result = CNPJ.investigate("11222333000181")
+
+        assert result == {"cnpj": "11222333000181"}
+        _, kwargs = mock_get.call_args
+        assert kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_cache_persistente(self, mock_get, tmp_path):
+        """Testa que o cache em SQLite sobrevive a uma nova configuração."""
+        path = str(tmp_path / "cnpj_cache.sqlite")
+        CNPJ.configure_cache(path)
+        mock_get.return_value = self._response(200, {"cnpj": "11222333000181"})
+        CNPJ.investigate("11222333000181")
+
+        CNPJ.configure_cache(path)
+        assert CNPJ.investigate("11222333000181") == {"cnpj": "11222333000181"}
+        assert mock_get.call_count == 1
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_resultado_alterado_nao_corrompe_cache(self, mock_get):
+        """Testa que alterar a resposta devolvida não altera o cache."""
+        CNPJ.configure_cache()
+        mock_get.return_value = self._response(
+            200, {"cnpj": "11222333000181", "socios": []}
+        )
+
+        CNPJ.investigate("11222333000181")["socios"].append("alterado")
+
+        assert CNPJ.investigate("11222333000181")["socios"] == []
+        assert mock_get.call_count == 1
+
+    @patch('cpf_cnpj_brasil.cnpj_validator_gemini._SESSION.get')
+    def test_limite_de_tamanho_descarta_mais_antigo(self, mock_get):
+        """Testa que o cache em memória descarta a entrada usada há mais tempo."""
+        CNPJ.configure_cache(max_size=2)
+        mock_get.return_value = self._response(200, {"cnpj": "qualquer"})
+
+        CNPJ.investigate("11222333000181")
+        CNPJ.investigate("11444777000161")
+        CNPJ.investigate("11222333000181")  # Renova o uso do primeiro
+        CNPJ.investigate("34028316000103")  # Descarta o segundo
+        assert mock_get.call_count == 3
+
+        CNPJ.investigate("11222333000181")
+        assert mock_get.call_count == 3
+        CNPJ.investigate("11444777000161")
+        assert mock_get.call_count == 4
+
+
 class TestCNPJExtractAndWaitForRelease:
     """Testes para o método _extract_and_wait_for_release."""
 
@@ -491,6 +927,22 @@ class TestCNPJExtractAndWaitForRelease:
         wait_time = CNPJ._extract_and_wait_for_release(message)
         assert wait_time == 0.0
 
+    def test_data_com_fuso_horario(self):
+        """Testa que o fuso horário da mensagem é aplicado ao cálculo."""
+        message = "Tente após Mon Oct 27 2025 14:30:00 GMT-0300"
+        now = datetime(2025, 10, 27, 17, 29, 0, tzinfo=timezone.utc)
+        with patch('cpf_cnpj_brasil.cnpj_validator_gemini.datetime') as mock_dt:
+            mock_dt.side_effect = datetime
+            mock_dt.now.return_value = now
+            wait_time = CNPJ._extract_and_wait_for_release(message)
+        assert wait_time == 60.0
+
+    def test_mes_invalido(self):
+        """Testa mensagem com mês inexistente."""
+        message = "Tente após Mon Foo 27 2025 14:30:00 GMT-0300"
+        with pytest.raises(CNPJAPIError):
+            CNPJ._extract_and_wait_for_release(message)
+
 
 class TestCNPJIntegration:
     """Testes de integração entre os métodos."""
@@ -0,0 +1,119 @@
+"""Testes unitários para a classe legada CPFValidator."""
+import pytest
+
+from cpf_cnpj_brasil.cpf_validator import CPFValidator
+
+
+@pytest.fixture
+def validator():
+    """Instância nova do validador para cada teste."""
+    return CPFValidator()
+
+
+class TestCPFValidatorValidate:
+    """Testes para o método validate_cpf."""
+
+    def test_validar_cpf_valido(self, validator):
+        """Testa CPFs válidos conhecidos."""
+        assert validator.validate_cpf("11144477735") is True
+        assert validator.validate_cpf("52998224725") is True
+
+    def test_validar_cpf_formatado(self, validator):
+        """Testa CPF válido com pontuação e espaços."""
+        assert validator.validate_cpf("111.444.777-35") is True
+        assert validator.validate_cpf(" 529.982.247-25\n") is True
+
+    def test_validar_cpf_inteiro(self, validator):
+        """Testa CPF válido como inteiro, inclusive com zeros à esquerda."""
+        assert validator.validate_cpf(11144477735) is True
+        assert validator.validate_cpf(1234567890) is True  # "01234567890"
+        assert validator.validate_cpf(1234567891) is False
+
+    def test_validar_cpf_digito_errado(self, validator):
+        """Testa CPFs com dígito verificador errado."""
+        assert validator.validate_cpf("11144477736") is False
+        assert validator.validate_cpf("11144477745") is False
+
+    def test_validar_cpf_todos_iguais(self, validator):
+        """Testa que CPFs com todos os dígitos iguais são inválidos."""
+        for digit in "0123456789":
+            assert validator.validate_cpf(digit * 11) is False
+
+    def test_validar_cpf_tamanho_invalido(self, validator):
+        """Testa que CPF com tamanho errado levanta ValueError."""
+        with pytest.raises(ValueError):
+            validator.validate_cpf("1114447773")
+        with pytest.raises(ValueError):
+            validator.validate_cpf(123456789012)
+
+    def test_validar_cpf_none(self, validator):
+        """Testa que None levanta ValueError."""
+        with pytest.raises(ValueError):
+            validator.validate_cpf(None)
+
+    def test_validar_cpf_float(self, validator):
+        """Testa que float levanta ValueError."""
+        with pytest.raises(ValueError):
+            validator.validate_cpf(11144477735.0)
+
+    def test_validar_cpf_digitos_nao_ascii(self, validator):
+        """Testa que dígitos não ASCII (ex: '１') levantam ValueError."""
+        with pytest.raises(ValueError):
+            validator.validate_cpf("１１１４４４７７７３５")
+
+    def test_validar_cpf_espaco_nao_separavel(self, validator):
+        """Testa que espaço não separável (NBSP) invalida o formato."""
+        with pytest.raises(ValueError):
+            validator.validate_cpf("111.444.777-35\u00a0")
+
+
+class TestCPFValidatorFormat:
+    """Testes para o método format_cpf."""
+
+    def test_formatar_cpf_string(self):
+        """Testa formatação de CPF string sem formatação."""
+        assert CPFValidator.format_cpf("11144477735") == "111.444.777-35"
+
+    def test_formatar_cpf_inteiro_com_zeros_a_esquerda(self):
+        """Testa formatação de CPF inteiro com zeros à esquerda."""
+        assert CPFValidator.format_cpf(1234567890) == "012.345.678-90"
+
+    def test_formatar_cpf_ja_formatado(self):
+        """Testa formatação de CPF já formatado."""
+        assert CPFValidator.format_cpf("111.444.777-35") == "111.444.777-35"
+
+    def test_formatar_cpf_invalido(self):
+        """Testa que formato inválido levanta ValueError."""
+        with pytest.raises(ValueError):
+            CPFValidator.format_cpf("123")
+
+
+class TestCPFValidatorCalculateDigit:
+    """Testes para o método _calculate_digit."""
+
+    def test_primeiro_digito(self, validator):
+        """Testa o primeiro dígito verificador (9 dígitos)."""
+        assert validator._calculate_digit("111444777") == 3
+        assert validator._calculate_digit("529982247") == 2
+
+    def test_segundo_digito(self, validator):
+        """Testa o segundo dígito verificador (10 dígitos)."""
+        assert validator._calculate_digit("1114447773") == 5
+        assert validator._calculate_digit("5299822472") == 5
+
+    def test_resto_menor_que_2(self, validator):
+        """Testa caso onde o resto é menor que 2 (dígito = 0)."""
+        assert validator._calculate_digit("000000006") == 0
+
+    def test_tamanho_invalido(self, validator):
+        """Testa CPF parcial com tamanho diferente de 9 ou 10."""
+        with pytest.raises(ValueError) as excinfo:
+            validator._calculate_digit("12345678")
+        assert "9 ou 10 dígitos" in str(excinfo.value)
+
+    def test_caractere_invalido(self, validator):
+        """Testa CPF parcial com caracteres não numéricos."""
+        with pytest.raises(ValueError):
+            validator._calculate_digit("12345678A")
+        with pytest.raises(ValueError):
+            validator._calculate_digit("１１１４４４７７７")
@@ -1,5 +1,7 @@
 """Testes unitários para o módulo CPF."""
 
+from unittest.mock import patch
+
 import pytest
 from cpf_cnpj_brasil.cpf_validator_gemini import CPF
 from cpf_cnpj_brasil.exceptions import CPFValidationError
@@ -52,12 +54,40 @@ class TestCPFValidateInputFormat:
             CPF._validate_input_format("12345678ABC")
         assert "formato inválido" in str(excinfo.value).lower()
 
+    def test_cpf_com_digitos_unicode(self):
+        """Testa que dígitos não ASCII (ex: '１') são rejeitados."""
+        with pytest.raises(CPFValidationError):
+            CPF._validate_input_format("１１１４４４７７７３５")
+        assert CPF.validate("１１１４４４７７７３５") is False
+
+    def test_cpf_com_espaco_nao_separavel(self):
+        """Testa que espaço não separável (NBSP) invalida o CPF.
+
+        Apenas pontuação (. - /) e espaços ASCII são removidos.
+        """
+        with pytest.raises(CPFValidationError):
+            CPF._validate_input_format("111.444.777-35\u00a0")
+        assert CPF.validate("111\u00a0444\u00a0777\u00a035") is False
+        assert CPF.validate("111 444 777 35") == "11144477735"
+
     def test_cpf_tipo_invalido(self):
         """Testa CPF com tipo inválido (não string nem inteiro)."""
         with pytest.raises(CPFValidationError) as excinfo:
             CPF._validate_input_format(12.345)
         assert "string ou inteiro" in str(excinfo.value).lower()
 
+    def test_cpf_booleano(self):
+        """Testa que bool (subclasse de int) é rejeitado."""
+        with pytest.raises(CPFValidationError) as excinfo:
+            CPF._validate_input_format(True)
+        assert "string ou inteiro" in str(excinfo.value).lower()
+        with pytest.raises(CPFValidationError):
+            CPF.format(True)
+        with pytest.raises(CPFValidationError):
+            CPF.format(False)
+        assert CPF.validate(True) is False
+        assert CPF.validate(False) is False
+
     def test_cpf_none(self):
         """Testa CPF None."""
         with pytest.raises(CPFValidationError) as excinfo:
@@ -104,12 +134,24 @@ class TestCPFCalculateDigit:
             CPF._calculate_digit("")
         assert "9 ou 10 dígitos" in str(excinfo.value).lower()
 
+    def test_cpf_parcial_com_letras(self):
+        """Testa CPF parcial com caracteres não numéricos."""
+        with pytest.raises(CPFValidationError) as excinfo:
+            CPF._calculate_digit("12345678A")
+        assert "apenas dígitos" in str(excinfo.value).lower()
+
     def test_digito_quando_resto_menor_que_2(self):
         """Testa caso onde o resto é menor que 2 (dígito = 0)."""
         # CPF que gera resto < 2: precisamos encontrar um exemplo
         result = CPF._calculate_digit("000000006")
         assert result == 0
 
+    def test_digitos_a_partir_de_bytes(self):
+        """Testa o cálculo sobre buffers ASCII (bytes e bytearray)."""
+        assert CPF._calc_digits_ascii(b"111444777") == (3, 5)
+        assert CPF._calc_digits_ascii(bytearray(b"111444777")) == (3, 5)
+        assert CPF._calc_digits_ascii(b"529982247") == (2, 5)
+
 
 class TestCPFFormat:
     """Testes para o método format."""
@@ -249,6 +291,44 @@ class TestCPFValidate:
         result = CPF.validate("111@444#777-35")
         assert result is False
 
+    def test_validar_cpf_limpo_dispensa_limpeza(self):
+        """Testa que CPF já limpo não passa pela limpeza memoizada."""
+        with patch(
+            'cpf_cnpj_brasil.cpf_validator_gemini._clean_string',
+            return_value="11144477735"
+        ) as mock_clean:
+            assert CPF.validate("11144477735") == "11144477735"
+            assert CPF.validate("111.444.777-35") == "11144477735"
+        assert mock_clean.call_count == 1
+
+
+class TestCPFValidateBatch:
+    """Testes para o método validate_batch."""
+
+    def test_lote_misto(self):
+        """Testa lote com CPFs válidos, inválidos e mal formados."""
+        cpfs = [
+            "111.444.777-35",
+            11144477735,
+            "111.444.777-36",
+            "111.111.111-11",
+            "123",
+            None,
+            -1,
+        ]
+        assert CPF.validate_batch(cpfs) == [
+            True, True, False, False, False, False, False
+        ]
+
+    def test_lote_vazio(self):
+        """Testa lote vazio."""
+        assert CPF.validate_batch([]) == []
+
+    def test_equivale_a_validate(self):
+        """Testa que o lote concorda com validate item a item."""
+        cpfs = ["529.982.247-25", "52998224726", "00000000191", "111@444#777-35"]
+        assert CPF.validate_batch(cpfs) == [bool(CPF.validate(cpf)) for cpf in cpfs]
+
 
 class TestCPFIntegration:
     """Testes de integração entre os métodos."""